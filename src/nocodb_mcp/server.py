@@ -8,11 +8,32 @@ Supports CRUD operations, table management, and base operations.
 """
 
 import asyncio
+import base64
+import contextlib
+import contextvars
+import csv
+import gzip
+import hashlib
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Sequence
+import random
+import re
+import sqlite3
+import time
+from collections import OrderedDict, deque
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 import httpx
+try:
+    import orjson
+except ImportError:  # optional: faster JSON serialization of tool results
+    orjson = None
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional: Parquet output of export_records
+    pyarrow = None
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.server.stdio import stdio_server
@@ -30,10 +51,355 @@ from mcp.types import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("nocodb-mcp")
 
+class TokenBucket:
+    """Async token bucket that paces how often an operation may start."""
+    
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        # Created lazily so the bucket can be built outside a running event loop
+        self._lock: Optional[asyncio.Lock] = None
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+class DeadlineExceededError(Exception):
+    """Raised when a tool call runs out of its per-call deadline."""
+
+# Absolute time.monotonic() deadline of the current tool call, if any. Tasks
+# started by the call (page prefetches, bulk chunks) inherit it.
+current_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar('current_deadline', default=None)
+
+class CircuitOpenError(Exception):
+    """Raised instead of contacting NoCoDB while the circuit breaker is open."""
+    
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class CircuitBreaker:
+    """Fails requests fast while the NoCoDB upstream looks down.
+    
+    After `failure_threshold` consecutive upstream failures the circuit opens
+    and requests raise CircuitOpenError without being sent. Once
+    `reset_timeout` seconds have passed it is half-open: a single probe
+    request is let through, closing the circuit on success or re-opening it
+    on failure. A threshold of 0 disables the breaker.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self._opened_at = 0.0
+        self._probing = False
+    
+    def before_request(self) -> bool:
+        """Raise CircuitOpenError if a request may not be sent; return True if it is the half-open probe."""
+        if self.failure_threshold <= 0 or self.state == self.CLOSED:
+            return False
+        if self.state == self.OPEN:
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0:
+                raise CircuitOpenError(
+                    f"NoCoDB is unavailable (circuit breaker open after {self.consecutive_failures} "
+                    f"consecutive failures); not retrying for another {remaining:.0f}s", remaining)
+            self.state = self.HALF_OPEN
+        if self._probing:
+            raise CircuitOpenError("NoCoDB is unavailable (circuit breaker half-open, probe request in progress)",
+                                   1.0)
+        self._probing = True
+        return True
+    
+    def record(self, success: Optional[bool], probe: bool = False) -> None:
+        """Record a request's outcome: True, False for an upstream failure, None if it was abandoned."""
+        if probe:
+            self._probing = False
+        if self.failure_threshold <= 0 or success is None:
+            return
+        if success:
+            if self.state != self.CLOSED:
+                logger.info("NoCoDB is reachable again, closing circuit breaker")
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            return
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+                logger.warning(f"Opening circuit breaker after {self.consecutive_failures} consecutive failures")
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        retry_in = None
+        if self.state == self.OPEN:
+            retry_in = max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'times_opened': self.times_opened,
+            'retry_in': retry_in
+        }
+
+class PersistentMetadataStore:
+    """SQLite-backed store of /meta responses that survives server restarts.
+    
+    Rows are keyed by NoCoDB host and endpoint, tagged with the owning base so
+    they can be dropped per base, and ignored once older than `ttl` seconds or
+    written by a different store format version.
+    """
+    
+    FORMAT_VERSION = 1
+    
+    def __init__(self, path: str, host: str, ttl: float = 86400.0):
+        self.path = os.path.expanduser(path)
+        self.host = host
+        self.ttl = ttl
+        self.hits = 0
+        self._db: Optional[sqlite3.Connection] = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use, creating the schema if needed."""
+        if self._db is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS meta_cache ("
+                " host TEXT NOT NULL, endpoint TEXT NOT NULL, base_id TEXT, kind TEXT NOT NULL,"
+                " format_version INTEGER NOT NULL, stored_at REAL NOT NULL, body TEXT NOT NULL,"
+                " PRIMARY KEY (host, endpoint))"
+            )
+            self._db.execute(
+                "DELETE FROM meta_cache WHERE format_version != ? OR stored_at < ?",
+                (self.FORMAT_VERSION, time.time() - self.ttl)
+            )
+            self._db.commit()
+        return self._db
+    
+    @staticmethod
+    def _base_of(endpoint: str, value: Any) -> Optional[str]:
+        """Best-effort owning base ID of a cached response."""
+        match = re.match(r'/meta/bases/([^/]+)', endpoint)
+        if match:
+            return match.group(1)
+        if isinstance(value, dict):
+            return value.get('base_id')
+        return None
+    
+    def get(self, endpoint: str) -> Optional[tuple]:
+        """Return (kind, value) for a valid stored response, or None."""
+        row = self._connect().execute(
+            "SELECT kind, body FROM meta_cache"
+            " WHERE host = ? AND endpoint = ? AND format_version = ? AND stored_at >= ?",
+            (self.host, endpoint, self.FORMAT_VERSION, time.time() - self.ttl)
+        ).fetchone()
+        if row is None:
+            return None
+        self.hits += 1
+        return row[0], json.loads(row[1])
+    
+    def set(self, endpoint: str, kind: str, value: Any) -> None:
+        """Store a response, replacing any previous copy."""
+        db = self._connect()
+        db.execute(
+            "INSERT OR REPLACE INTO meta_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self.host, endpoint, self._base_of(endpoint, value), kind,
+             self.FORMAT_VERSION, time.time(), json.dumps(value))
+        )
+        db.commit()
+    
+    def invalidate(self, prefix: Optional[str] = None, kind: Optional[str] = None) -> None:
+        """Drop stored responses for an endpoint (and everything below it) and/or of a kind."""
+        clauses, args = [], []
+        if prefix is not None:
+            escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            clauses.append("endpoint = ? OR endpoint LIKE ? ESCAPE '\\'")
+            args.extend([prefix, escaped + '/%'])
+        if kind is not None:
+            clauses.append("kind = ?")
+            args.append(kind)
+        if not clauses:
+            return
+        db = self._connect()
+        db.execute(
+            f"DELETE FROM meta_cache WHERE host = ? AND (({') OR ('.join(clauses)}))",
+            [self.host] + args
+        )
+        db.commit()
+    
+    def clear(self) -> None:
+        """Drop every stored response for this host."""
+        db = self._connect()
+        db.execute("DELETE FROM meta_cache WHERE host = ?", (self.host,))
+        db.commit()
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of hits and stored entries for this host."""
+        count = self._connect().execute(
+            "SELECT COUNT(*) FROM meta_cache WHERE host = ?", (self.host,)
+        ).fetchone()[0]
+        return {'path': self.path, 'hits': self.hits, 'size': count, 'ttl': self.ttl}
+
+class MetadataCache:
+    """In-process TTL + LRU cache for NoCoDB /meta responses.
+    
+    Entries are keyed by endpoint and tagged with a kind ('bases', 'base',
+    'tables', 'table', 'views') that selects their TTL. An optional
+    PersistentMetadataStore is written through and consulted on cold misses,
+    so a restarted server can answer its first metadata calls locally. Once a
+    key has been cached in this process, an expired entry is always refetched
+    upstream, so the per-kind TTLs still apply with persistence enabled.
+    """
+    
+    DEFAULT_TTLS = {
+        'bases': 300.0,
+        'base': 300.0,
+        'tables': 120.0,
+        'table': 60.0,
+        'views': 60.0
+    }
+    
+    def __init__(self, max_entries: int = 256, ttls: Optional[Dict[str, float]] = None,
+                 store: Optional[PersistentMetadataStore] = None):
+        self.max_entries = max_entries
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.store = store
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # Keys cached since this process started; only other keys are read from the store
+        self._seen: set = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return a fresh cached value, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, _, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        if self.store is not None and key not in self._seen:
+            stored = self.store.get(key)
+            if stored is not None:
+                kind, value = stored
+                self.hits += 1
+                self._remember(key, kind, value)
+                return value
+        self.misses += 1
+        return None
+    
+    def set(self, key: str, kind: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entries beyond max_entries."""
+        if self.ttls.get(kind, 0.0) <= 0:
+            return
+        self._remember(key, kind, value)
+        if self.store is not None:
+            self.store.set(key, kind, value)
+    
+    def _remember(self, key: str, kind: str, value: Any) -> None:
+        """Keep a value in memory for its kind's TTL."""
+        self._seen.add(key)
+        ttl = self.ttls.get(kind, 0.0)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, kind, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self, prefix: Optional[str] = None, kind: Optional[str] = None) -> None:
+        """Drop entries for an endpoint (and everything below it) and/or of a kind."""
+        for key in list(self._entries):
+            if (prefix is not None and (key == prefix or key.startswith(prefix + '/'))) \
+                    or (kind is not None and self._entries[key][1] == kind):
+                del self._entries[key]
+        if self.store is not None:
+            self.store.invalidate(prefix, kind)
+    
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        if self.store is not None:
+            self.store.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        lookups = self.hits + self.misses
+        stats = {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'max_entries': self.max_entries
+        }
+        if self.store is not None:
+            stats['persistent'] = self.store.stats()
+        return stats
+
 class NocoDBClient:
     """Client for interacting with remote NoCoDB API through Cloudflare Access."""
     
-    def __init__(self, base_url: str, api_token: str, cf_client_id: str, cf_client_secret: str):
+    def __init__(self, base_url: str, api_token: str, cf_client_id: str, cf_client_secret: str,
+                 max_connections: int = 20, max_keepalive_connections: int = 10,
+                 keepalive_expiry: float = 30.0, http2: bool = False,
+                 transport: Optional[httpx.AsyncBaseTransport] = None,
+                 page_rate_limit: float = 0.0,
+                 meta_cache_size: int = 256,
+                 meta_cache_ttls: Optional[Dict[str, float]] = None,
+                 validator_cache_size: int = 256,
+                 meta_cache_path: Optional[str] = None,
+                 meta_cache_persist_ttl: float = 86400.0,
+                 bulk_chunk_size: int = 100,
+                 bulk_chunk_bytes: int = 1_000_000,
+                 bulk_concurrency: int = 4,
+                 retry_attempts: int = 3,
+                 retry_backoff: float = 0.5,
+                 retry_max_backoff: float = 30.0,
+                 retry_methods: Sequence[str] = ('GET',),
+                 request_rate_limit: float = 0.0,
+                 max_concurrent_requests: int = 0,
+                 circuit_failure_threshold: int = 5,
+                 circuit_reset_timeout: float = 30.0,
+                 timeouts: Optional[Dict[str, float]] = None,
+                 connect_timeout: float = 5.0,
+                 pool_timeout: float = 10.0,
+                 export_dir: str = '~/nocodb-exports'):
         self.base_url = base_url.rstrip('/')
         self.api_token = api_token
         self.cf_client_id = cf_client_id
@@ -46,46 +412,387 @@ class NocoDBClient:
             'CF-Access-Client-Id': self.cf_client_id,
             'CF-Access-Client-Secret': self.cf_client_secret
         }
+        
+        # Connection pool shared by every request made through this client, so
+        # repeated tool calls reuse keep-alive connections instead of paying
+        # DNS/TCP/TLS setup through Cloudflare each time.
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Opt-in HTTP/2: concurrent requests are multiplexed over a single
+        # connection instead of each holding a pooled HTTP/1.1 connection.
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "HTTP/2 mode requires the 'h2' package. "
+                    "Install it with: pip install 'nocodb-data-mcp[http2]'"
+                )
+        self.http2 = http2
+        # Custom transport (e.g. for benchmarks or h2c test servers); when set,
+        # it is responsible for its own connection limits.
+        self._transport = transport
+        
+        # Pages per second allowed across all parallel paginated reads (0 = unlimited)
+        self._page_limiter = TokenBucket(page_rate_limit) if page_rate_limit > 0 else None
+        
+        # Cache for bases, tables and schemas; invalidated by meta-mutating methods.
+        # With meta_cache_path set, it is also persisted to a SQLite file.
+        store = None
+        if meta_cache_path:
+            store = PersistentMetadataStore(meta_cache_path, self.base_url, meta_cache_persist_ttl)
+        self.meta_cache = MetadataCache(meta_cache_size, meta_cache_ttls, store)
+        
+        # In-flight GETs keyed by URL and query params, for request coalescing
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._inflight_waiters: Dict[asyncio.Future, int] = {}
+        self.coalesced_requests = 0
+        self.abandoned_requests = 0
+        
+        # ETag/Last-Modified validators and parsed bodies for conditional GETs
+        self.validator_cache_size = validator_cache_size
+        self._validators: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.conditional_stats = {'revalidations': 0, 'not_modified': 0}
+        
+        # Defaults for splitting bulk writes into chunks sent in parallel
+        self.bulk_chunk_size = bulk_chunk_size
+        self.bulk_chunk_bytes = bulk_chunk_bytes
+        self.bulk_concurrency = bulk_concurrency
+        
+        # Retries of transient failures (see _should_retry)
+        self.retry_attempts = retry_attempts
+        self.retry_backoff = retry_backoff
+        self.retry_max_backoff = retry_max_backoff
+        self.retry_methods = {method.upper() for method in retry_methods}
+        self.retry_stats = {'retries': 0, 'exhausted': 0}
+        
+        # Requests per second and requests in flight allowed across all tool calls
+        # (0 = unlimited). The rate adapts: halved when NoCoDB answers 429 and
+        # raised gradually back towards request_rate_limit while requests succeed.
+        self.request_rate_limit = request_rate_limit
+        self._request_limiter = TokenBucket(request_rate_limit) if request_rate_limit > 0 else None
+        self.max_concurrent_requests = max_concurrent_requests
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+        self._last_throttled = 0.0
+        self.throttle_stats = {'throttled': 0, 'in_flight': 0}
+        
+        # Fails calls fast while NoCoDB or the Cloudflare tunnel is down
+        self.circuit = CircuitBreaker(circuit_failure_threshold, circuit_reset_timeout)
+        
+        # Read/write timeout per operation class, with shared connect and pool timeouts
+        unknown = set(timeouts or {}) - set(self.DEFAULT_TIMEOUTS)
+        if unknown:
+            raise ValueError(f"Unknown timeout classes: {', '.join(sorted(unknown))} "
+                             f"(expected {', '.join(self.DEFAULT_TIMEOUTS)})")
+        self.timeouts = {
+            operation: httpx.Timeout(seconds, connect=connect_timeout, pool=pool_timeout)
+            for operation, seconds in {**self.DEFAULT_TIMEOUTS, **(timeouts or {})}.items()
+        }
+        
+        # Directory for exports written to disk when no output path is given
+        self.export_dir = os.path.expanduser(export_dir)
+    
+    # Default read/write timeouts in seconds per operation class
+    DEFAULT_TIMEOUTS = {'meta': 15.0, 'read': 30.0, 'write': 60.0, 'export': 300.0}
+    
+    @staticmethod
+    def operation_class(method: str, endpoint: str) -> str:
+        """Timeout class of a request: 'meta', 'read', 'write' or 'export'."""
+        if '/export/' in endpoint:
+            return 'export'
+        if endpoint.startswith('/meta/'):
+            return 'meta'
+        return 'read' if method == 'GET' else 'write'
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                limits=self.limits,
+                timeout=self.timeouts['read'],
+                http2=self.http2,
+                transport=self._transport
+            )
+        return self._client
     
-    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make authenticated request to NoCoDB API."""
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and release pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self.meta_cache.store is not None:
+            self.meta_cache.store.close()
+    
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Any] = None,
+                            params: Optional[Dict[str, Any]] = None,
+                            conditional: bool = False) -> Dict[str, Any]:
+        """Make authenticated request to NoCoDB API.
+        
+        Identical GETs that are already in flight are coalesced: later callers
+        wait for the first request and share its parsed result. The shared
+        request is cancelled once every caller waiting for it has been
+        cancelled. With conditional=True, GETs are revalidated with
+        ETag/Last-Modified and a 304 response reuses the previously parsed body.
+        
+        Other requests are bounded by the calling tool's deadline; shared GETs
+        are not, since their callers may have different deadlines, and instead
+        stop when all of those callers have given up.
+        """
         url = f"{self.base_url}/api/v2{endpoint}"
+        operation = self.operation_class(method, endpoint)
+        if method != 'GET':
+            return await self._send_request(method, url, data, params, operation=operation,
+                                            deadline=current_deadline.get())
+        
+        key = (url, tuple(sorted((k, str(v)) for k, v in (params or {}).items())))
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced_requests += 1
+        else:
+            inflight = asyncio.ensure_future(
+                self._send_request(method, url, data, params, key if conditional else None, operation))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(
+                lambda done: self._inflight.pop(key) if self._inflight.get(key) is done else None)
+        
+        self._inflight_waiters[inflight] = self._inflight_waiters.get(inflight, 0) + 1
+        try:
+            # Shielded so one caller being cancelled does not fail the others
+            return await asyncio.shield(inflight)
+        finally:
+            self._inflight_waiters[inflight] -= 1
+            if not self._inflight_waiters[inflight]:
+                del self._inflight_waiters[inflight]
+                if not inflight.done():
+                    # Every caller was cancelled; free the connection instead of finishing unread work.
+                    # Unregister it first so a new caller starts a fresh request instead of
+                    # attaching to the cancelled one.
+                    if self._inflight.get(key) is inflight:
+                        del self._inflight[key]
+                    self.abandoned_requests += 1
+                    inflight.cancel()
+    
+    async def _send_request(self, method: str, url: str, data: Optional[Any],
+                            params: Optional[Dict[str, Any]],
+                            validator_key: Optional[tuple] = None,
+                            operation: str = 'read',
+                            deadline: Optional[float] = None) -> Dict[str, Any]:
+        """Send a single request and parse its JSON response."""
+        client = self._get_client()
+        
+        headers = {}
+        validators = self._validators.get(validator_key) if validator_key else None
+        if validators is not None:
+            etag, last_modified, _ = validators
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+            self.conditional_stats['revalidations'] += 1
+        
+        try:
+            response = await self._request_with_retries(client, method, url, data, params, headers,
+                                                        operation, deadline)
+            if response.status_code == 304 and validators is not None:
+                self.conditional_stats['not_modified'] += 1
+                self._validators.move_to_end(validator_key)
+                return validators[2]
+            response.raise_for_status()
+            result = response.json() if response.content else {}
+            if validator_key is not None:
+                self._store_validators(validator_key, response, result)
+            return result
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP error: {e}")
+            raise Exception(f"API request failed: {str(e)}")
+        except (CircuitOpenError, DeadlineExceededError):
+            raise
+        except Exception as e:
+            logger.error(f"Request error: {e}")
+            raise Exception(f"Request failed: {str(e)}")
+    
+    # Responses worth retrying: throttling and gateway/edge errors
+    RETRY_STATUS_CODES = {429, 502, 503, 504}
+    # Failures raised before the request reached NoCoDB, safe to retry for any method
+    UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+    
+    @staticmethod
+    def _upstream_down(status_code: int) -> bool:
+        """Whether a status means NoCoDB could not be reached (gateway and Cloudflare origin errors)."""
+        return status_code in (502, 503, 504) or 520 <= status_code <= 530
+    
+    def _should_retry(self, method: str, attempt: int, processed: bool) -> bool:
+        """Decide whether a failed attempt may be repeated.
         
-        async with httpx.AsyncClient() as client:
+        Methods in `retry_methods` (GET by default) are retried on any transient
+        failure. Other methods, such as POST inserts, are retried only when
+        NoCoDB cannot have processed the request: connection failures and 429
+        responses. This avoids duplicate writes.
+        """
+        if attempt >= self.retry_attempts:
+            return False
+        return method in self.retry_methods or not processed
+    
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Seconds to wait before the next attempt: Retry-After if given, else exponential backoff with full jitter."""
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(delay, 0.0), self.retry_max_backoff)
+        return random.uniform(0, min(self.retry_max_backoff, self.retry_backoff * 2 ** attempt))
+    
+    @contextlib.asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        """Wait for a concurrency slot and a rate limit token before sending a request."""
+        if self.max_concurrent_requests > 0 and self._request_semaphore is None:
+            # Created lazily so the client can be built outside a running event loop
+            self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        async with (self._request_semaphore or contextlib.AsyncExitStack()):
+            if self._request_limiter is not None:
+                await self._request_limiter.acquire()
+            self.throttle_stats['in_flight'] += 1
             try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    json=data,
-                    timeout=30.0
+                yield
+            finally:
+                self.throttle_stats['in_flight'] -= 1
+    
+    def _adapt_rate(self, throttled: bool) -> None:
+        """Adjust the request rate: halve it on a 429, otherwise raise it slowly (AIMD)."""
+        if throttled:
+            self.throttle_stats['throttled'] += 1
+        limiter = self._request_limiter
+        if limiter is None:
+            return
+        if throttled:
+            now = time.monotonic()
+            # One cut per second, so a burst of concurrent 429s counts once
+            if now - self._last_throttled >= 1.0:
+                self._last_throttled = now
+                limiter.rate = max(limiter.rate / 2, min(1.0, self.request_rate_limit))
+                logger.warning(f"NoCoDB is throttling requests, lowering rate to {limiter.rate:.1f}/s")
+        elif limiter.rate < self.request_rate_limit:
+            # About +5% of the configured rate per second of successful requests
+            limiter.rate = min(self.request_rate_limit,
+                               limiter.rate + 0.05 * self.request_rate_limit / limiter.rate)
+    
+    async def _request_with_retries(self, client: httpx.AsyncClient, method: str, url: str,
+                                    data: Optional[Any], params: Optional[Dict[str, Any]],
+                                    headers: Dict[str, str], operation: str = 'read',
+                                    deadline: Optional[float] = None, stream: bool = False) -> httpx.Response:
+        """Send a request, retrying transient failures with backoff.
+        
+        Each attempt uses the timeout profile of its operation class, shortened
+        to what is left before `deadline` (a time.monotonic() value), if given.
+        With stream=True the body is not read; the caller must close the
+        response. Only failures before the body is read are retried.
+        """
+        attempt = 0
+        while True:
+            timeout = self.timeouts[operation]
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DeadlineExceededError(f"Deadline exceeded before {method} {url} could be sent")
+                timeout = httpx.Timeout(
+                    min(timeout.read, remaining), connect=min(timeout.connect, remaining),
+                    pool=min(timeout.pool, remaining)
                 )
-                response.raise_for_status()
-                return response.json() if response.content else {}
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP error: {e}")
-                raise Exception(f"API request failed: {str(e)}")
-            except Exception as e:
-                logger.error(f"Request error: {e}")
-                raise Exception(f"Request failed: {str(e)}")
+            probe = self.circuit.before_request()
+            response: Optional[httpx.Response] = None
+            try:
+                request = client.build_request(
+                    method, url, json=data, params=params, headers=headers, timeout=timeout
+                )
+                async with self._request_slot():
+                    response = await client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                if isinstance(e, httpx.TimeoutException) and deadline is not None and time.monotonic() >= deadline:
+                    # Cut short by the caller's deadline, not a sign of an upstream outage
+                    self.circuit.record(None, probe)
+                    raise DeadlineExceededError(f"Deadline exceeded during {method} {url}") from e
+                self.circuit.record(False, probe)
+                if not self._should_retry(method, attempt, not isinstance(e, self.UNSENT_ERRORS)):
+                    if attempt:
+                        self.retry_stats['exhausted'] += 1
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(f"{method} {url} failed ({e!r}), retrying in {delay:.2f}s")
+            except BaseException:
+                self.circuit.record(None, probe)
+                raise
+            else:
+                self.circuit.record(not self._upstream_down(response.status_code), probe)
+                self._adapt_rate(response.status_code == 429)
+                if response.status_code not in self.RETRY_STATUS_CODES:
+                    return response
+                if not self._should_retry(method, attempt, response.status_code != 429):
+                    if attempt:
+                        self.retry_stats['exhausted'] += 1
+                    return response
+                delay = self._retry_delay(attempt, response)
+                logger.warning(f"{method} {url} returned {response.status_code}, retrying in {delay:.2f}s")
+                if stream and (deadline is None or time.monotonic() + delay < deadline):
+                    await response.aclose()
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                # No time left for another attempt; report this one's failure
+                if response is not None:
+                    return response
+                raise DeadlineExceededError(f"Deadline exceeded while retrying {method} {url}")
+            self.retry_stats['retries'] += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+    
+    def _store_validators(self, key: tuple, response: httpx.Response, result: Any) -> None:
+        """Remember a response's ETag/Last-Modified validators with its parsed body."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            self._validators.pop(key, None)
+            return
+        self._validators[key] = (etag, last_modified, result)
+        self._validators.move_to_end(key)
+        while len(self._validators) > self.validator_cache_size:
+            self._validators.popitem(last=False)
+    
+    async def _get_meta(self, endpoint: str, kind: str) -> Any:
+        """GET a /meta endpoint through the metadata cache."""
+        cached = self.meta_cache.get(endpoint)
+        if cached is not None:
+            return cached
+        result = await self._make_request('GET', endpoint, conditional=True)
+        self.meta_cache.set(endpoint, kind, result)
+        return result
     
     async def list_bases(self) -> List[Dict[str, Any]]:
         """List all bases (projects) in NoCoDB."""
-        result = await self._make_request('GET', '/meta/bases')
+        result = await self._get_meta('/meta/bases', 'bases')
         return result.get('list', []) if isinstance(result, dict) else result
     
     async def get_base_info(self, base_id: str) -> Dict[str, Any]:
         """Get detailed information about a specific base."""
-        return await self._make_request('GET', f'/meta/bases/{base_id}/info')
+        return await self._get_meta(f'/meta/bases/{base_id}/info', 'base')
     
     async def list_tables(self, base_id: str) -> List[Dict[str, Any]]:
         """List all tables in a base."""
-        result = await self._make_request('GET', f'/meta/bases/{base_id}/tables')
+        result = await self._get_meta(f'/meta/bases/{base_id}/tables', 'tables')
         return result.get('list', []) if isinstance(result, dict) else result
     
     async def get_table_info(self, table_id: str) -> Dict[str, Any]:
         """Get detailed information about a table."""
-        return await self._make_request('GET', f'/meta/tables/{table_id}')
+        return await self._get_meta(f'/meta/tables/{table_id}', 'table')
     
     async def create_base(self, title: str, description: str = "") -> Dict[str, Any]:
         """Create a new base."""
@@ -93,7 +800,10 @@ class NocoDBClient:
             'title': title,
             'description': description
         }
-        return await self._make_request('POST', '/meta/bases', data)
+        try:
+            return await self._make_request('POST', '/meta/bases', data)
+        finally:
+            self.meta_cache.invalidate(kind='bases')
     
     async def create_table(self, base_id: str, title: str, table_name: str, columns: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Create a new table in a base."""
@@ -102,50 +812,78 @@ class NocoDBClient:
             'title': title,
             'columns': columns
         }
-        return await self._make_request('POST', f'/meta/bases/{base_id}/tables', data)
+        try:
+            return await self._make_request('POST', f'/meta/bases/{base_id}/tables', data)
+        finally:
+            self.meta_cache.invalidate(f'/meta/bases/{base_id}/tables')
     
     async def create_column(self, table_id: str, column_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new column in a table."""
-        return await self._make_request('POST', f'/meta/tables/{table_id}/columns', column_data)
+        try:
+            return await self._make_request('POST', f'/meta/tables/{table_id}/columns', column_data)
+        finally:
+            self.meta_cache.invalidate(f'/meta/tables/{table_id}')
     
     async def update_column(self, table_id: str, column_id: str, column_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing column."""
-        return await self._make_request('PATCH', f'/meta/tables/{table_id}/columns/{column_id}', column_data)
+        try:
+            return await self._make_request('PATCH', f'/meta/tables/{table_id}/columns/{column_id}', column_data)
+        finally:
+            self.meta_cache.invalidate(f'/meta/tables/{table_id}')
     
     async def delete_column(self, table_id: str, column_id: str) -> Dict[str, Any]:
         """Delete a column from a table."""
-        return await self._make_request('DELETE', f'/meta/tables/{table_id}/columns/{column_id}')
+        try:
+            return await self._make_request('DELETE', f'/meta/tables/{table_id}/columns/{column_id}')
+        finally:
+            self.meta_cache.invalidate(f'/meta/tables/{table_id}')
     
     async def duplicate_table(self, table_id: str, options: Dict[str, Any]) -> Dict[str, Any]:
         """Duplicate a table with specified options."""
-        return await self._make_request('POST', f'/meta/tables/{table_id}/duplicate', options)
+        try:
+            return await self._make_request('POST', f'/meta/tables/{table_id}/duplicate', options)
+        finally:
+            # The owning base is not known here, so drop every cached table list
+            self.meta_cache.invalidate(kind='tables')
     
     async def delete_table(self, table_id: str) -> Dict[str, Any]:
         """Delete a table."""
-        return await self._make_request('DELETE', f'/meta/tables/{table_id}')
+        try:
+            return await self._make_request('DELETE', f'/meta/tables/{table_id}')
+        finally:
+            self.meta_cache.invalidate(f'/meta/tables/{table_id}', kind='tables')
     
     async def create_view(self, table_id: str, view_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new view for a table."""
         view_type = view_data.get('type', 'grid')
         if view_type == 'grid':
-            return await self._make_request('POST', f'/meta/tables/{table_id}/grids', view_data)
+            endpoint = f'/meta/tables/{table_id}/grids'
         elif view_type == 'form':
-            return await self._make_request('POST', f'/meta/tables/{table_id}/forms', view_data)
+            endpoint = f'/meta/tables/{table_id}/forms'
         elif view_type == 'gallery':
-            return await self._make_request('POST', f'/meta/tables/{table_id}/galleries', view_data)
+            endpoint = f'/meta/tables/{table_id}/galleries'
         elif view_type == 'kanban':
-            return await self._make_request('POST', f'/meta/tables/{table_id}/kanbans', view_data)
+            endpoint = f'/meta/tables/{table_id}/kanbans'
         else:
             raise ValueError(f"Unsupported view type: {view_type}")
+        try:
+            return await self._make_request('POST', endpoint, view_data)
+        finally:
+            self.meta_cache.invalidate(f'/meta/tables/{table_id}')
     
     async def list_views(self, table_id: str) -> List[Dict[str, Any]]:
         """List all views for a table."""
-        result = await self._make_request('GET', f'/meta/tables/{table_id}/views')
+        result = await self._get_meta(f'/meta/tables/{table_id}/views', 'views')
         return result.get('list', []) if isinstance(result, dict) else result
     
     async def delete_view(self, view_id: str) -> Dict[str, Any]:
         """Delete a view."""
-        return await self._make_request('DELETE', f'/meta/views/{view_id}')
+        try:
+            return await self._make_request('DELETE', f'/meta/views/{view_id}')
+        finally:
+            # The owning table is not known here, so drop view lists and table schemas
+            self.meta_cache.invalidate(kind='views')
+            self.meta_cache.invalidate(kind='table')
     
     async def create_filter(self, view_id: str, filter_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a filter for a view."""
@@ -190,10 +928,182 @@ class NocoDBClient:
         """Test a webhook configuration."""
         return await self._make_request('POST', f'/meta/tables/{table_id}/hooks/test', webhook_data)
     
-    async def get_table_data(self, table_id: str, limit: int = 25, offset: int = 0) -> Dict[str, Any]:
-        """Get data from a table."""
-        endpoint = f'/tables/{table_id}/records?limit={limit}&offset={offset}'
-        return await self._make_request('GET', endpoint)
+    async def get_table_data(self, table_id: str, limit: int = 25, offset: int = 0,
+                             fields: Optional[List[str]] = None, where: Optional[str] = None,
+                             sort: Optional[str] = None, view_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get data from a table.
+        
+        `where` uses NoCoDB filter syntax, e.g. `(Status,eq,Done)~and(Amount,gt,100)`;
+        `sort` is a comma-separated list of fields, prefixed with `-` for
+        descending order; `view_id` applies a view's filters and sorts. All are
+        evaluated by the database.
+        """
+        params: Dict[str, Any] = {'limit': limit, 'offset': offset}
+        if fields:
+            params['fields'] = ','.join(fields)
+        if where:
+            params['where'] = where
+        if sort:
+            params['sort'] = sort
+        if view_id:
+            params['viewId'] = view_id
+        return await self._make_request('GET', f'/tables/{table_id}/records', params=params)
+    
+    @staticmethod
+    def encode_cursor(table_id: str, key_field: str, last_value: Any) -> str:
+        """Encode a keyset position as an opaque continuation token."""
+        payload = json.dumps({'t': table_id, 'k': key_field, 'v': last_value}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+    
+    @staticmethod
+    def decode_cursor(table_id: str, cursor: str) -> Dict[str, Any]:
+        """Decode a continuation token produced by encode_cursor."""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            key_field, last_value, cursor_table = payload['k'], payload['v'], payload['t']
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("Invalid cursor")
+        if cursor_table != table_id:
+            raise ValueError("Cursor does not belong to this table")
+        return {'key_field': key_field, 'last_value': last_value}
+    
+    async def get_table_data_keyset(self, table_id: str, limit: int = 25, cursor: Optional[str] = None,
+                                    fields: Optional[List[str]] = None, where: Optional[str] = None,
+                                    key_field: str = 'Id', view_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get a page of records using keyset pagination.
+        
+        Instead of an OFFSET scan, each page is selected with `(key_field,gt,<last>)`
+        sorted by `key_field`, so late pages cost the same as early ones. The
+        returned `next_cursor` is an opaque token for the following page, or None
+        when there are no more records.
+        """
+        conditions = []
+        if cursor:
+            position = self.decode_cursor(table_id, cursor)
+            key_field = position['key_field']
+            conditions.append(f"({key_field},gt,{position['last_value']})")
+        if where:
+            conditions.append(f"({where})" if conditions else where)
+        if fields and key_field not in fields:
+            fields = fields + [key_field]
+        
+        page = await self.get_table_data(
+            table_id, limit, 0, fields=fields, where='~and'.join(conditions) or None, sort=key_field,
+            view_id=view_id
+        )
+        records = page.get('list', [])
+        page['next_cursor'] = None
+        if records and not self._is_last_page(page, limit):
+            last_value = records[-1].get(key_field)
+            if last_value is None:
+                raise ValueError(f"Records do not include the cursor field '{key_field}'")
+            page['next_cursor'] = self.encode_cursor(table_id, key_field, last_value)
+        return page
+    
+    async def _fetch_page(self, table_id: str, page_size: int, offset: int,
+                          fields: Optional[List[str]], where: Optional[str]) -> Dict[str, Any]:
+        """Fetch a single page of records, honouring the page rate limit."""
+        if self._page_limiter is not None:
+            await self._page_limiter.acquire()
+        return await self.get_table_data(table_id, page_size, offset, fields=fields, where=where)
+    
+    @staticmethod
+    def _is_last_page(page: Dict[str, Any], page_size: int) -> bool:
+        """Whether a records page is the final one of the result set."""
+        records = page.get('list', [])
+        is_last_page = page.get('pageInfo', {}).get('isLastPage')
+        if is_last_page is None:
+            is_last_page = len(records) < page_size
+        return bool(is_last_page) or not records
+    
+    async def iter_records(self, table_id: str, page_size: int = 200,
+                           fields: Optional[List[str]] = None,
+                           where: Optional[str] = None,
+                           concurrency: int = 1,
+                           keyset: bool = False,
+                           key_field: str = 'Id') -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every record in a table, holding only one page in memory at a time.
+        
+        With concurrency > 1, the remaining pages are prefetched in parallel once the
+        total row count is known, keeping at most `concurrency` pages in flight while
+        still yielding records in order.
+        
+        With keyset=True, pages are walked with a `key_field` cursor instead of
+        offsets (see get_table_data_keyset); pages are then fetched sequentially.
+        """
+        if keyset:
+            cursor = None
+            while True:
+                if self._page_limiter is not None:
+                    await self._page_limiter.acquire()
+                page = await self.get_table_data_keyset(
+                    table_id, page_size, cursor, fields=fields, where=where, key_field=key_field
+                )
+                for record in page.get('list', []):
+                    yield record
+                cursor = page['next_cursor']
+                if cursor is None:
+                    return
+        
+        page = await self._fetch_page(table_id, page_size, 0, fields, where)
+        offset = 0
+        
+        # NoCoDB caps `limit` at its configured maximum; step by what it actually
+        # returns so offsets line up with the rows received.
+        first_page = page.get('list', [])
+        if first_page and len(first_page) < page_size and not self._is_last_page(page, page_size):
+            logger.warning(f"NoCoDB returned {len(first_page)} rows for a page of {page_size}; "
+                           f"using {len(first_page)} as the page size")
+            page_size = len(first_page)
+        
+        if concurrency > 1 and not self._is_last_page(page, page_size):
+            total = page.get('pageInfo', {}).get('totalRows')
+            if total is None:
+                count = await self.get_table_count(table_id, where)
+                total = count.get('count', 0)
+            
+            offsets = iter(range(page_size, total, page_size))
+            pending: deque = deque()
+            
+            def prefetch(page_offset: int) -> None:
+                pending.append((page_offset, asyncio.ensure_future(
+                    self._fetch_page(table_id, page_size, page_offset, fields, where))))
+            
+            try:
+                for next_offset in offsets:
+                    prefetch(next_offset)
+                    if len(pending) >= concurrency:
+                        break
+                
+                while pending:
+                    for record in page.get('list', []):
+                        yield record
+                    offset, task = pending.popleft()
+                    page = await task
+                    if len(page.get('list', [])) < page_size and not self._is_last_page(page, page_size):
+                        raise ValueError(
+                            f"Page at offset {offset} returned {len(page.get('list', []))} of {page_size} rows; "
+                            "rows would be skipped (was the table modified during the read?)"
+                        )
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        prefetch(next_offset)
+            finally:
+                for _, task in pending:
+                    task.cancel()
+                await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+        
+        # Sequential walk from the offset of the current page; also picks up
+        # rows added after the total was counted
+        while True:
+            records = page.get('list', [])
+            for record in records:
+                yield record
+            if self._is_last_page(page, page_size):
+                break
+            offset += len(records)
+            page = await self._fetch_page(table_id, page_size, offset, fields, where)
     
     async def create_record(self, table_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new record in a table."""
@@ -207,45 +1117,745 @@ class NocoDBClient:
         """Delete a record from a table."""
         return await self._make_request('DELETE', f'/tables/{table_id}/records/{record_id}')
     
-    async def get_record(self, table_id: str, record_id: str) -> Dict[str, Any]:
+    async def get_record(self, table_id: str, record_id: str,
+                         fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Get a specific record from a table."""
-        return await self._make_request('GET', f'/tables/{table_id}/records/{record_id}')
+        params = {'fields': ','.join(fields)} if fields else None
+        return await self._make_request('GET', f'/tables/{table_id}/records/{record_id}',
+                                        params=params, conditional=True)
+    
+    @staticmethod
+    def chunk_items(items: Sequence[Any], chunk_size: int, chunk_bytes: int) -> List[Tuple[int, List[Any]]]:
+        """Split items into (start_index, chunk) pairs bounded by row count and JSON size.
+        
+        Chunking is deterministic, so the same items and limits always produce
+        the same chunk indexes.
+        """
+        chunks: List[Tuple[int, List[Any]]] = []
+        current: List[Any] = []
+        current_bytes = 0
+        start = 0
+        for index, item in enumerate(items):
+            size = len(json.dumps(item, separators=(',', ':'))) + 1
+            if current and (len(current) >= chunk_size or current_bytes + size > chunk_bytes):
+                chunks.append((start, current))
+                start, current, current_bytes = index, [], 0
+            current.append(item)
+            current_bytes += size
+        if current:
+            chunks.append((start, current))
+        return chunks
+    
+    async def _run_batches(self, method: str, endpoint: str, items: Sequence[Any],
+                           build_body: Callable[[List[Any]], Any],
+                           chunk_size: Optional[int] = None, chunk_bytes: Optional[int] = None,
+                           concurrency: Optional[int] = None,
+                           only_chunks: Optional[List[int]] = None,
+                           row_id: Optional[Callable[[Any], Any]] = None,
+                           positions: Optional[Sequence[Optional[int]]] = None,
+                           semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+        """Send items to a bulk endpoint in chunks, at most `concurrency` at a time.
+        
+        A failed chunk does not stop the others; its index is reported in
+        `failed_chunks` so the same call can be repeated with
+        `only_chunks=failed_chunks` to resume. Every row of a failed chunk is
+        listed in `failed_rows` by input index, ID (if `row_id` is given) and
+        chunk, whose entry in `chunks` carries the error. `positions` maps
+        items to their index in the caller's input when `items` is derived
+        from it; items mapped to None are reported without an index. Calls
+        that run together can pass one `semaphore` to share a single
+        concurrency limit, in which case `concurrency` is ignored.
+        """
+        chunks = self.chunk_items(items, chunk_size or self.bulk_chunk_size,
+                                  chunk_bytes or self.bulk_chunk_bytes)
+        selected = list(range(len(chunks))) if only_chunks is None else sorted(set(only_chunks))
+        invalid = [index for index in selected if not 0 <= index < len(chunks)]
+        if invalid:
+            raise ValueError(f"Unknown chunk indexes {invalid}; there are {len(chunks)} chunks")
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, concurrency or self.bulk_concurrency))
+        
+        async def submit(index: int) -> Dict[str, Any]:
+            start, chunk = chunks[index]
+            outcome: Dict[str, Any] = {'chunk': index, 'start': start, 'count': len(chunk)}
+            async with semaphore:
+                try:
+                    outcome['result'] = await self._make_request(method, endpoint, build_body(chunk))
+                    outcome['status'] = 'ok'
+                except Exception as e:
+                    outcome['status'] = 'failed'
+                    outcome['error'] = str(e)
+            return outcome
+        
+        outcomes = await asyncio.gather(*(submit(index) for index in selected))
+        failed = [outcome for outcome in outcomes if outcome['status'] == 'failed']
+        failed_rows = []
+        for outcome in failed:
+            for offset, item in enumerate(chunks[outcome['chunk']][1]):
+                index = outcome['start'] + offset
+                row: Dict[str, Any] = {}
+                if positions is None:
+                    row['index'] = index
+                elif positions[index] is not None:
+                    row['index'] = positions[index]
+                if row_id is not None:
+                    row['id'] = row_id(item)
+                row['chunk'] = outcome['chunk']
+                failed_rows.append(row)
+        return {
+            'total_records': len(items),
+            'total_chunks': len(chunks),
+            'submitted_chunks': len(outcomes),
+            'succeeded_records': sum(outcome['count'] for outcome in outcomes if outcome['status'] == 'ok'),
+            'failed_records': sum(outcome['count'] for outcome in failed),
+            'failed_chunks': [outcome['chunk'] for outcome in failed],
+            'failed_rows': failed_rows,
+            'chunks': outcomes
+        }
+    
+    async def bulk_insert_records(self, table_id: str, records: List[Dict[str, Any]],
+                                  chunk_size: Optional[int] = None, chunk_bytes: Optional[int] = None,
+                                  concurrency: Optional[int] = None,
+                                  only_chunks: Optional[List[int]] = None) -> Dict[str, Any]:
+        """Bulk insert multiple records into a table, in chunks sent in parallel."""
+        return await self._run_batches(
+            'POST', f'/tables/{table_id}/records', records, lambda chunk: chunk,
+            chunk_size, chunk_bytes, concurrency, only_chunks
+        )
+    
+    async def bulk_update_records(self, table_id: str, records: List[Dict[str, Any]],
+                                  chunk_size: Optional[int] = None, chunk_bytes: Optional[int] = None,
+                                  concurrency: Optional[int] = None,
+                                  only_chunks: Optional[List[int]] = None) -> Dict[str, Any]:
+        """Bulk update multiple records in a table, in chunks sent in parallel."""
+        return await self._run_batches(
+            'PATCH', f'/tables/{table_id}/records', records, lambda chunk: chunk,
+            chunk_size, chunk_bytes, concurrency, only_chunks,
+            row_id=lambda record: record.get('Id')
+        )
     
-    async def bulk_insert_records(self, table_id: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Bulk insert multiple records into a table."""
-        return await self._make_request('POST', f'/tables/{table_id}/records', records)
+    async def bulk_delete_records(self, table_id: str, record_ids: List[str],
+                                  chunk_size: Optional[int] = None, chunk_bytes: Optional[int] = None,
+                                  concurrency: Optional[int] = None,
+                                  only_chunks: Optional[List[int]] = None) -> Dict[str, Any]:
+        """Bulk delete multiple records from a table, in chunks sent in parallel."""
+        return await self._run_batches(
+            'DELETE', f'/tables/{table_id}/records', record_ids, lambda chunk: {'ids': chunk},
+            chunk_size, chunk_bytes, concurrency, only_chunks,
+            row_id=lambda record_id: record_id
+        )
+    
+    @staticmethod
+    def _index_by_key(records: List[Dict[str, Any]], key: str) -> Dict[str, Dict[str, Any]]:
+        """Map each record's key value (as a string) to the record, rejecting missing or duplicate keys."""
+        index: Dict[str, Dict[str, Any]] = {}
+        for position, record in enumerate(records):
+            if record.get(key) is None:
+                raise ValueError(f"Record {position} has no value for key column '{key}'")
+            value = str(record[key])
+            if value in index:
+                raise ValueError(f"Duplicate key value {value!r} in record {position}")
+            index[value] = record
+        return index
+    
+    @staticmethod
+    def row_hash(record: Dict[str, Any], fields: Sequence[str]) -> str:
+        """Hash of a record's values for `fields`, insensitive to value types.
+        
+        Values are compared as text so that rows read from CSV (all strings)
+        match the typed values NoCoDB returns, and an empty string equals null.
+        """
+        values = {}
+        for field in fields:
+            value = record.get(field)
+            if value == '':
+                value = None
+            elif value is not None and not isinstance(value, str):
+                value = json.dumps(value, sort_keys=True, separators=(',', ':'))
+            values[field] = value
+        return hashlib.sha1(json.dumps(values, sort_keys=True).encode()).hexdigest()
     
-    async def bulk_update_records(self, table_id: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Bulk update multiple records in a table."""
-        return await self._make_request('PATCH', f'/tables/{table_id}/records', records)
+    async def sync_table(self, table_id: str, records: List[Dict[str, Any]], key: str,
+                         delete_missing: bool = True, dry_run: bool = False,
+                         chunk_size: Optional[int] = None, chunk_bytes: Optional[int] = None,
+                         concurrency: Optional[int] = None, allow_empty: bool = False) -> Dict[str, Any]:
+        """Make a table match `records`, writing only the rows that differ.
+        
+        The current rows are streamed with keyset pagination and compared to the
+        desired records by `key`, using hashes of the desired records' fields.
+        New keys are inserted, changed rows updated and, with delete_missing,
+        rows whose key is not in `records` deleted, all through the chunked
+        bulk endpoints. With dry_run, only the planned changes are returned.
+        
+        An empty `records` with delete_missing would empty the table, so it is
+        refused unless allow_empty is set.
+        """
+        if not records and delete_missing and not allow_empty:
+            raise ValueError("The desired record set is empty, which would delete every row; "
+                             "pass allow_empty to empty the table")
+        desired = self._index_by_key(records, key)
+        positions = {value: position for position, value in enumerate(desired)}
+        primary_key = await self._primary_key(table_id)
+        fields = list(dict.fromkeys([primary_key, key] + [field for record in records for field in record]))
+        
+        seen = set()
+        updates: List[Dict[str, Any]] = []
+        deletes: List[Any] = []
+        current = 0
+        async for row in self.iter_records(table_id, fields=fields, keyset=True, key_field=primary_key):
+            current += 1
+            value = None if row.get(key) is None else str(row[key])
+            record = desired.get(value) if value is not None else None
+            if record is None or value in seen:
+                deletes.append(row.get(primary_key))
+                continue
+            seen.add(value)
+            if self.row_hash(record, list(record)) != self.row_hash(row, list(record)):
+                updates.append(dict(record, **{primary_key: row.get(primary_key)}))
+        inserts = [record for value, record in desired.items() if value not in seen]
+        if not delete_missing:
+            deletes = []
+        
+        result: Dict[str, Any] = {
+            'key': key,
+            'primary_key': primary_key,
+            'dry_run': dry_run,
+            'desired_rows': len(desired),
+            'current_rows': current,
+            'unchanged': len(seen) - len(updates),
+            'to_insert': len(inserts),
+            'to_update': len(updates),
+            'to_delete': len(deletes)
+        }
+        if dry_run:
+            result['preview'] = {
+                'insert': [record[key] for record in inserts[:20]],
+                'update': [record[key] for record in updates[:20]],
+                'delete': deletes[:20]
+            }
+            return result
+        
+        endpoint = f'/tables/{table_id}/records'
+        # One limit for all three writes, so at most `concurrency` chunks are in flight
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.bulk_concurrency))
+        result['inserted'], result['updated'], result['deleted'] = await asyncio.gather(
+            self._run_batches('POST', endpoint, inserts, lambda chunk: chunk,
+                              chunk_size, chunk_bytes, concurrency,
+                              row_id=lambda record: record.get(key),
+                              positions=[positions[str(record[key])] for record in inserts],
+                              semaphore=semaphore),
+            self._run_batches('PATCH', endpoint, updates, lambda chunk: chunk,
+                              chunk_size, chunk_bytes, concurrency,
+                              row_id=lambda record: record.get(key),
+                              positions=[positions[str(record[key])] for record in updates],
+                              semaphore=semaphore),
+            # Deleted rows are not in `records`, so they are reported by ID only
+            self._run_batches('DELETE', endpoint, deletes, lambda chunk: {'ids': chunk},
+                              chunk_size, chunk_bytes, concurrency,
+                              row_id=lambda record_id: record_id, positions=[None] * len(deletes),
+                              semaphore=semaphore)
+        )
+        return result
     
-    async def bulk_delete_records(self, table_id: str, record_ids: List[str]) -> Dict[str, Any]:
-        """Bulk delete multiple records from a table."""
-        data = {'ids': record_ids}
-        return await self._make_request('DELETE', f'/tables/{table_id}/records', data)
+    async def upsert_records(self, table_id: str, records: List[Dict[str, Any]], key: str,
+                             chunk_size: Optional[int] = None, chunk_bytes: Optional[int] = None,
+                             concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """Insert or update records matched on the `key` column.
+        
+        Existing rows are looked up in batches with `(key,in,...)` filters, then
+        records whose key exists are sent as chunked bulk updates (with the
+        row's primary key filled in) and the rest as chunked bulk inserts.
+        """
+        keys = self._index_by_key(records, key)
+        for value in keys:
+            if ',' in value or ')' in value:
+                raise ValueError(f"Key value {value!r} cannot be used in an 'in' filter")
+        
+        primary_key = await self._primary_key(table_id)
+        lookup_size = chunk_size or self.bulk_chunk_size
+        unique_keys = list(keys)
+        existing: Dict[str, Any] = {}
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.bulk_concurrency))
+        
+        async def lookup(batch: List[str]) -> None:
+            async with semaphore:
+                async for row in self.iter_records(
+                    table_id, page_size=len(batch), fields=list(dict.fromkeys([primary_key, key])),
+                    where=f"({key},in,{','.join(batch)})"
+                ):
+                    existing.setdefault(str(row.get(key)), row.get(primary_key))
+        
+        await asyncio.gather(*(
+            lookup(unique_keys[start:start + lookup_size])
+            for start in range(0, len(unique_keys), lookup_size)
+        ))
+        
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        # Positions of the inserted/updated records in `records`, for failed_rows
+        insert_positions: List[int] = []
+        update_positions: List[int] = []
+        for position, record in enumerate(records):
+            value = str(record[key])
+            if value in existing:
+                updates.append(dict(record, **{primary_key: existing[value]}))
+                update_positions.append(position)
+            else:
+                inserts.append(record)
+                insert_positions.append(position)
+        
+        # The lookup semaphore also bounds the writes, so at most `concurrency` chunks are in flight
+        inserted, updated = await asyncio.gather(
+            self._run_batches('POST', f'/tables/{table_id}/records', inserts, lambda chunk: chunk,
+                              chunk_size, chunk_bytes, concurrency,
+                              row_id=lambda record: record.get(key), positions=insert_positions,
+                              semaphore=semaphore),
+            self._run_batches('PATCH', f'/tables/{table_id}/records', updates, lambda chunk: chunk,
+                              chunk_size, chunk_bytes, concurrency,
+                              row_id=lambda record: record.get(key), positions=update_positions,
+                              semaphore=semaphore)
+        )
+        return {
+            'key': key,
+            'primary_key': primary_key,
+            'matched': len(updates),
+            'inserted': inserted,
+            'updated': updated
+        }
     
     async def get_table_schema(self, table_id: str) -> Dict[str, Any]:
         """Get the complete schema information for a table including columns, relations, etc."""
-        return await self._make_request('GET', f'/meta/tables/{table_id}')
+        return await self._get_meta(f'/meta/tables/{table_id}', 'table')
+    
+    # Column types left out of "light" reads because their values are large
+    HEAVY_COLUMN_TYPES = {
+        'LongText', 'RichText', 'JSON', 'Attachment', 'Geometry', 'LinkToAnotherRecord', 'Lookup'
+    }
+    
+    async def get_light_fields(self, table_id: str) -> List[str]:
+        """Field names of a table excluding heavy column types, from the cached schema."""
+        schema = await self.get_table_schema(table_id)
+        return [
+            column['title'] for column in schema.get('columns', [])
+            if column.get('pk') or (
+                column.get('uidt') not in self.HEAVY_COLUMN_TYPES and not column.get('system')
+            )
+        ]
+    
+    async def _primary_key(self, table_id: str) -> str:
+        """Title of the table's primary key column from the cached schema, falling back to 'Id'."""
+        schema = await self.get_table_schema(table_id)
+        for column in schema.get('columns', []):
+            if column.get('pk'):
+                return column['title']
+        return 'Id'
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Return client-side counters (cache usage, etc.) for diagnostics."""
+        return {
+            'meta_cache': self.meta_cache.stats(),
+            'coalesced_requests': self.coalesced_requests,
+            'abandoned_requests': self.abandoned_requests,
+            'conditional_requests': dict(self.conditional_stats, cached_validators=len(self._validators)),
+            'retries': dict(self.retry_stats),
+            'rate_limit': dict(
+                self.throttle_stats,
+                rate=self._request_limiter.rate if self._request_limiter is not None else None,
+                max_rate=self.request_rate_limit or None,
+                max_concurrent=self.max_concurrent_requests or None
+            ),
+            'circuit_breaker': self.circuit.stats()
+        }
+    
+    async def export_table_data(self, table_id: str, export_type: str = 'csv') -> Any:
+        """Export table data in various formats (csv, excel, json) and return it in memory.
+        
+        JSON exports are returned parsed. CSV exports are returned as text and
+        Excel workbooks base64-encoded, under `content` with the content type.
+        """
+        if export_type == 'json':
+            return await self._make_request('GET', f'/tables/{table_id}/export/{export_type}')
+        url = f"{self.base_url}/api/v2/tables/{table_id}/export/{export_type}"
+        try:
+            response = await self._request_with_retries(
+                self._get_client(), 'GET', url, None, None, {}, 'export', current_deadline.get()
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP error: {e}")
+            raise Exception(f"API request failed: {str(e)}")
+        result = {
+            'table_id': table_id,
+            'export_type': export_type,
+            'content_type': response.headers.get('Content-Type')
+        }
+        if export_type == 'csv':
+            result['content'] = response.text
+        else:
+            result['encoding'] = 'base64'
+            result['content'] = base64.b64encode(response.content).decode('ascii')
+        return result
+    
+    # File extensions of the server-side export formats
+    EXPORT_EXTENSIONS = {'csv': '.csv', 'excel': '.xlsx', 'json': '.json'}
+    
+    def export_path(self, table_id: str, extension: str, output_path: Optional[str] = None) -> str:
+        """Absolute path for an export file, defaulting to a timestamped name in export_dir."""
+        if not output_path:
+            output_path = os.path.join(
+                self.export_dir, f"{table_id}-{time.strftime('%Y%m%d-%H%M%S')}{extension}"
+            )
+        path = os.path.abspath(os.path.expanduser(output_path))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+    
+    @staticmethod
+    def file_sha256(path: str) -> str:
+        """SHA-256 checksum of a file, read in 1 MiB chunks."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    async def export_table_data_to_file(self, table_id: str, export_type: str = 'csv',
+                                        output_path: Optional[str] = None) -> Dict[str, Any]:
+        """Stream a server-side export to a local file without holding it in memory.
+        
+        The body is written in chunks to `<path>.part` and renamed once
+        complete, so a failed export never leaves a truncated file behind.
+        Returns the path, size and SHA-256 checksum of the file.
+        """
+        path = self.export_path(table_id, self.EXPORT_EXTENSIONS.get(export_type, ''), output_path)
+        partial = path + '.part'
+        url = f"{self.base_url}/api/v2/tables/{table_id}/export/{export_type}"
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            response = await self._request_with_retries(
+                self._get_client(), 'GET', url, None, None, {}, 'export', current_deadline.get(), stream=True
+            )
+            try:
+                response.raise_for_status()
+                with open(partial, 'wb') as f:
+                    async for chunk in response.aiter_bytes():
+                        f.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+            finally:
+                await response.aclose()
+            os.replace(partial, path)
+        except BaseException as e:
+            if os.path.exists(partial):
+                os.remove(partial)
+            if isinstance(e, httpx.HTTPError):
+                logger.error(f"HTTP error: {e}")
+                raise Exception(f"API request failed: {str(e)}")
+            raise
+        return {
+            'table_id': table_id,
+            'export_type': export_type,
+            'path': path,
+            'size': size,
+            'sha256': digest.hexdigest(),
+            'content_type': response.headers.get('Content-Type')
+        }
     
-    async def export_table_data(self, table_id: str, export_type: str = 'csv') -> Dict[str, Any]:
-        """Export table data in various formats (csv, excel, json)."""
-        return await self._make_request('GET', f'/tables/{table_id}/export/{export_type}')
+    async def export_records(self, table_id: str, output_format: str = 'ndjson',
+                             output_path: Optional[str] = None,
+                             fields: Optional[List[str]] = None, where: Optional[str] = None,
+                             page_size: int = 200, concurrency: int = 1, keyset: bool = False,
+                             row_group_size: int = 10000, compression: Optional[str] = None,
+                             progress: Optional[Callable[[int, Optional[int]], Awaitable[None]]] = None
+                             ) -> Dict[str, Any]:
+        """Export records page by page to a local NDJSON, CSV or Parquet file.
+        
+        Records are streamed with iter_records and written in row groups of
+        `row_group_size` by RecordExportWriter, so memory use stays constant.
+        CSV and Parquet columns are `fields` or the table's non-system columns;
+        Parquet column types follow the NoCoDB column types. `progress` is
+        awaited after every page with the rows written so far and the total.
+        """
+        if output_format not in RecordExportWriter.FORMATS:
+            raise ValueError(f"Unsupported export format: {output_format} "
+                             f"(expected one of {', '.join(RecordExportWriter.FORMATS)})")
+        if compression is not None and compression not in RecordExportWriter.COMPRESSIONS[output_format]:
+            raise ValueError(f"Unsupported compression for {output_format}: {compression} "
+                             f"(expected one of {', '.join(RecordExportWriter.COMPRESSIONS[output_format])})")
+        if output_format == 'parquet' and pyarrow is None:
+            raise ImportError(
+                "Parquet export requires the 'pyarrow' package. "
+                "Install it with: pip install 'nocodb-data-mcp[parquet]'"
+            )
+        
+        schema = await self.get_table_schema(table_id)
+        column_types = {column['title']: column.get('uidt') for column in schema.get('columns', [])}
+        columns = fields or [
+            column['title'] for column in schema.get('columns', [])
+            if column.get('pk') or not column.get('system')
+        ]
+        total = None
+        if progress is not None:
+            total = (await self.get_table_count(table_id, where)).get('count')
+        
+        extension = RecordExportWriter.FORMATS[output_format]
+        if compression == 'gzip' and output_format != 'parquet':
+            extension += '.gz'
+        path = self.export_path(table_id, extension, output_path)
+        partial = path + '.part'
+        writer = RecordExportWriter(partial, output_format, columns, column_types, compression, row_group_size)
+        rows = 0
+        try:
+            records = self.iter_records(
+                table_id, page_size, fields=fields, where=where, concurrency=concurrency, keyset=keyset
+            )
+            async for record in records:
+                writer.write(record)
+                rows += 1
+                if progress is not None and rows % page_size == 0:
+                    await progress(rows, total)
+            writer.close()
+            os.replace(partial, path)
+        except BaseException:
+            writer.close()
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+        if progress is not None:
+            await progress(rows, total)
+        
+        # Hashing a multi-GB file takes seconds; keep it off the event loop
+        sha256 = await asyncio.get_running_loop().run_in_executor(None, self.file_sha256, path)
+        return {
+            'table_id': table_id,
+            'format': output_format,
+            'compression': compression or ('snappy' if output_format == 'parquet' else None),
+            'path': path,
+            'rows': rows,
+            'row_groups': writer.row_groups,
+            'columns': columns,
+            'size': os.path.getsize(path),
+            'sha256': sha256
+        }
     
-    async def get_table_count(self, table_id: str, where: Optional[str] = None) -> Dict[str, Any]:
+    async def get_table_count(self, table_id: str, where: Optional[str] = None,
+                              view_id: Optional[str] = None) -> Dict[str, Any]:
         """Get the count of records in a table with optional filtering."""
         params = {'count': 'true'}
         if where:
             params['where'] = where
-        endpoint = f'/tables/{table_id}/count'
-        if params:
-            query_string = '&'.join([f'{k}={v}' for k, v in params.items()])
-            endpoint += f'?{query_string}'
-        return await self._make_request('GET', endpoint)
+        if view_id:
+            params['viewId'] = view_id
+        return await self._make_request('GET', f'/tables/{table_id}/count', params=params)
+
+class RecordExportWriter:
+    """Writes a stream of records to an NDJSON, CSV or Parquet file in row groups.
+    
+    Records are buffered up to `row_group_size` and then written as one batch
+    (one row group in Parquet), so memory use does not grow with table size.
+    """
+    
+    # File extension per output format
+    FORMATS = {'ndjson': '.ndjson', 'csv': '.csv', 'parquet': '.parquet'}
+    # Supported compression codecs per output format
+    COMPRESSIONS = {'ndjson': ('gzip',), 'csv': ('gzip',), 'parquet': ('snappy', 'gzip', 'zstd', 'brotli')}
+    # NoCoDB column types written as Parquet numbers or booleans; all others are strings
+    PARQUET_TYPES = {
+        'AutoNumber': 'int64', 'Number': 'int64', 'Year': 'int64', 'Rating': 'int64',
+        'Decimal': 'float64', 'Currency': 'float64', 'Percent': 'float64', 'Duration': 'float64',
+        'Checkbox': 'bool', 'ID': 'int64'
+    }
+    
+    def __init__(self, path: str, output_format: str, columns: List[str],
+                 column_types: Optional[Dict[str, str]] = None,
+                 compression: Optional[str] = None, row_group_size: int = 10000):
+        self.output_format = output_format
+        self.columns = columns
+        self.row_group_size = max(1, row_group_size)
+        self.row_groups = 0
+        self._batch: List[Dict[str, Any]] = []
+        self._closed = False
+        
+        if output_format == 'parquet':
+            self._types = {
+                column: self.PARQUET_TYPES.get((column_types or {}).get(column), 'string')
+                for column in columns
+            }
+            self._schema = pyarrow.schema([(column, self._types[column]) for column in columns])
+            self._parquet = pyarrow.parquet.ParquetWriter(path, self._schema, compression=compression or 'snappy')
+        else:
+            self._file = (gzip.open(path, 'wt', encoding='utf-8', newline='') if compression == 'gzip'
+                          else open(path, 'w', encoding='utf-8', newline=''))
+            if output_format == 'csv':
+                self._csv = csv.DictWriter(self._file, fieldnames=columns, extrasaction='ignore')
+                self._csv.writeheader()
+    
+    def write(self, record: Dict[str, Any]) -> None:
+        """Add a record, writing the current row group once it is full."""
+        self._batch.append(record)
+        if len(self._batch) >= self.row_group_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write the buffered records as one row group."""
+        if not self._batch:
+            return
+        if self.output_format == 'parquet':
+            table = pyarrow.Table.from_pydict({
+                column: [self._parquet_value(record.get(column), self._types[column], column)
+                         for record in self._batch]
+                for column in self.columns
+            }, schema=self._schema)
+            self._parquet.write_table(table)
+        elif self.output_format == 'csv':
+            self._csv.writerows(
+                {column: self._text_value(record.get(column)) for column in self.columns}
+                for record in self._batch
+            )
+        else:
+            self._file.writelines(
+                json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n' for record in self._batch
+            )
+        self.row_groups += 1
+        self._batch = []
+    
+    def close(self) -> None:
+        """Write any buffered records and close the file; safe to call twice."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            if self.output_format == 'parquet':
+                self._parquet.close()
+            else:
+                self._file.close()
+    
+    @staticmethod
+    def _text_value(value: Any) -> Any:
+        """CSV cell for a value: nested values (attachments, links, JSON) as JSON text."""
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+        return value
+    
+    @staticmethod
+    def _parquet_value(value: Any, arrow_type: str, column: str) -> Any:
+        """Convert a value to the Python type of its Parquet column."""
+        if value is None or value == '':
+            return None
+        try:
+            if arrow_type == 'int64':
+                if isinstance(value, (int, str)):
+                    with contextlib.suppress(ValueError):
+                        return int(value)
+                # Accept integral floats such as 3.0, but never truncate 1.5 to 1
+                number = float(value)
+                if not number.is_integer():
+                    raise ValueError(value)
+                return int(number)
+            if arrow_type == 'float64':
+                return float(value)
+            if arrow_type == 'bool':
+                return value.lower() in ('1', 'true', 'yes') if isinstance(value, str) else bool(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Value {value!r} of column '{column}' is not a valid {arrow_type}")
+        if isinstance(value, str):
+            return value
+        return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+class RecordAggregator:
+    """Incrementally computes per-column statistics over a stream of records."""
+    
+    # Bounds on tracked distinct values and groups so memory stays constant
+    # regardless of table size.
+    MAX_DISTINCT = 1000
+    MAX_GROUPS = 1000
+    
+    def __init__(self, group_by: Optional[str] = None):
+        self.group_by = group_by
+        self.row_count = 0
+        self.columns: Dict[str, Dict[str, Any]] = {}
+        self.groups: Dict[str, int] = {}
+        self.groups_truncated = False
+    
+    def add(self, record: Dict[str, Any]) -> None:
+        """Fold a single record into the running statistics."""
+        self.row_count += 1
+        for column, value in record.items():
+            stats = self.columns.get(column)
+            if stats is None:
+                stats = {'count': 0, 'nulls': 0, 'distinct': set(), 'distinct_truncated': False,
+                         'numeric': 0, 'min': None, 'max': None, 'sum': 0}
+                self.columns[column] = stats
+            
+            if value is None or value == '':
+                stats['nulls'] += 1
+                continue
+            stats['count'] += 1
+            
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                stats['numeric'] += 1
+                stats['sum'] += value
+                stats['min'] = value if stats['min'] is None else min(stats['min'], value)
+                stats['max'] = value if stats['max'] is None else max(stats['max'], value)
+            
+            if not stats['distinct_truncated'] and not isinstance(value, (dict, list)):
+                stats['distinct'].add(value)
+                if len(stats['distinct']) > self.MAX_DISTINCT:
+                    stats['distinct_truncated'] = True
+                    stats['distinct'] = set()
+        
+        if self.group_by:
+            key = str(record.get(self.group_by))
+            if key in self.groups:
+                self.groups[key] += 1
+            elif len(self.groups) < self.MAX_GROUPS:
+                self.groups[key] = 1
+            else:
+                self.groups_truncated = True
+    
+    def result(self) -> Dict[str, Any]:
+        """Return the aggregated statistics as a JSON-serializable dict."""
+        columns = {}
+        for column, stats in self.columns.items():
+            summary: Dict[str, Any] = {
+                'count': stats['count'],
+                'nulls': stats['nulls'],
+                'distinct': f"{self.MAX_DISTINCT}+" if stats['distinct_truncated'] else len(stats['distinct'])
+            }
+            if stats['numeric']:
+                summary.update({
+                    'min': stats['min'],
+                    'max': stats['max'],
+                    'sum': stats['sum'],
+                    'avg': stats['sum'] / stats['numeric']
+                })
+            columns[column] = summary
+        
+        result: Dict[str, Any] = {'row_count': self.row_count, 'columns': columns}
+        if self.group_by:
+            result['group_by'] = self.group_by
+            result['groups'] = self.groups
+            result['groups_truncated'] = self.groups_truncated
+        return result
 
 # Initialize the MCP server
 server = Server("nocodb-mcp")
 
+def parse_key_values(value: str) -> Dict[str, str]:
+    """Parse settings written as 'key=value,key=value'."""
+    pairs = {}
+    for item in value.split(','):
+        if '=' in item:
+            key, item_value = item.split('=', 1)
+            pairs[key.strip()] = item_value.strip()
+    return pairs
+
+def parse_ttls(value: str) -> Dict[str, float]:
+    """Parse per-kind durations in seconds written as 'bases=300,table=60'."""
+    return {kind: float(seconds) for kind, seconds in parse_key_values(value).items()}
+
 # Load configuration from JSON files
 def load_config():
     """Load configuration from JSON files."""
@@ -285,7 +1895,40 @@ def load_config():
         'host': f"https://{host}",
         'api_token': api_token,
         'cf_client_id': cf_client_id,
-        'cf_client_secret': cf_client_secret
+        'cf_client_secret': cf_client_secret,
+        # Connection pool tuning (optional, via environment variables)
+        'max_connections': int(os.environ.get('NOCODB_MAX_CONNECTIONS', '20')),
+        'max_keepalive_connections': int(os.environ.get('NOCODB_MAX_KEEPALIVE_CONNECTIONS', '10')),
+        'keepalive_expiry': float(os.environ.get('NOCODB_KEEPALIVE_EXPIRY', '30.0')),
+        'http2': os.environ.get('NOCODB_HTTP2', '').lower() in ('1', 'true', 'yes'),
+        'page_rate_limit': float(os.environ.get('NOCODB_PAGE_RATE_LIMIT', '0')),
+        'meta_cache_size': int(os.environ.get('NOCODB_META_CACHE_SIZE', '256')),
+        'meta_cache_ttls': parse_ttls(os.environ.get('NOCODB_META_CACHE_TTLS', '')),
+        'validator_cache_size': int(os.environ.get('NOCODB_VALIDATOR_CACHE_SIZE', '256')),
+        'meta_cache_path': os.environ.get('NOCODB_META_CACHE_PATH') or None,
+        'meta_cache_persist_ttl': float(os.environ.get('NOCODB_META_CACHE_PERSIST_TTL', '86400')),
+        # Tool result serialization (optional, via environment variables)
+        'output_format': os.environ.get('NOCODB_OUTPUT_FORMAT') or None,
+        'tool_output_formats': parse_key_values(os.environ.get('NOCODB_TOOL_OUTPUT_FORMATS', '')),
+        'max_response_bytes': int(os.environ.get('NOCODB_MAX_RESPONSE_BYTES', '200000')),
+        'light_reads': os.environ.get('NOCODB_LIGHT_READS', '').lower() in ('1', 'true', 'yes'),
+        'bulk_chunk_size': int(os.environ.get('NOCODB_BULK_CHUNK_SIZE', '100')),
+        'bulk_chunk_bytes': int(os.environ.get('NOCODB_BULK_CHUNK_BYTES', '1000000')),
+        'bulk_concurrency': int(os.environ.get('NOCODB_BULK_CONCURRENCY', '4')),
+        'retry_attempts': int(os.environ.get('NOCODB_RETRY_ATTEMPTS', '3')),
+        'retry_backoff': float(os.environ.get('NOCODB_RETRY_BACKOFF', '0.5')),
+        'retry_max_backoff': float(os.environ.get('NOCODB_RETRY_MAX_BACKOFF', '30')),
+        'retry_methods': [
+            method.strip() for method in os.environ.get('NOCODB_RETRY_METHODS', 'GET').split(',') if method.strip()
+        ],
+        'request_rate_limit': float(os.environ.get('NOCODB_REQUEST_RATE_LIMIT', '0')),
+        'max_concurrent_requests': int(os.environ.get('NOCODB_MAX_CONCURRENT_REQUESTS', '0')),
+        'circuit_failure_threshold': int(os.environ.get('NOCODB_CIRCUIT_FAILURE_THRESHOLD', '5')),
+        'circuit_reset_timeout': float(os.environ.get('NOCODB_CIRCUIT_RESET_TIMEOUT', '30')),
+        'timeouts': parse_ttls(os.environ.get('NOCODB_TIMEOUTS', '')),
+        'connect_timeout': float(os.environ.get('NOCODB_CONNECT_TIMEOUT', '5')),
+        'pool_timeout': float(os.environ.get('NOCODB_POOL_TIMEOUT', '10')),
+        'export_dir': os.environ.get('NOCODB_EXPORT_DIR', '~/nocodb-exports')
     }
 
 # Initialize client
@@ -294,999 +1937,1524 @@ nocodb_client = NocoDBClient(
     base_url=config['host'],
     api_token=config['api_token'],
     cf_client_id=config['cf_client_id'],
-    cf_client_secret=config['cf_client_secret']
+    cf_client_secret=config['cf_client_secret'],
+    max_connections=config['max_connections'],
+    max_keepalive_connections=config['max_keepalive_connections'],
+    keepalive_expiry=config['keepalive_expiry'],
+    http2=config['http2'],
+    page_rate_limit=config['page_rate_limit'],
+    meta_cache_size=config['meta_cache_size'],
+    meta_cache_ttls=config['meta_cache_ttls'],
+    validator_cache_size=config['validator_cache_size'],
+    meta_cache_path=config['meta_cache_path'],
+    meta_cache_persist_ttl=config['meta_cache_persist_ttl'],
+    bulk_chunk_size=config['bulk_chunk_size'],
+    bulk_chunk_bytes=config['bulk_chunk_bytes'],
+    bulk_concurrency=config['bulk_concurrency'],
+    retry_attempts=config['retry_attempts'],
+    retry_backoff=config['retry_backoff'],
+    retry_max_backoff=config['retry_max_backoff'],
+    retry_methods=config['retry_methods'],
+    request_rate_limit=config['request_rate_limit'],
+    max_concurrent_requests=config['max_concurrent_requests'],
+    circuit_failure_threshold=config['circuit_failure_threshold'],
+    circuit_reset_timeout=config['circuit_reset_timeout'],
+    timeouts=config['timeouts'],
+    connect_timeout=config['connect_timeout'],
+    pool_timeout=config['pool_timeout'],
+    export_dir=config['export_dir']
 )
 
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List available NoCoDB tools."""
-    return [
-        Tool(
-            name="list_bases",
-            description="List all bases (projects) in NoCoDB",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_base_info",
-            description="Get detailed information about a specific base",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "base_id": {
-                        "type": "string",
-                        "description": "The ID of the base to get information about"
-                    }
+# Tool result serialization. 'pretty' is indented JSON, 'compact' drops all
+# optional whitespace; orjson is used for both when it is installed.
+OUTPUT_FORMATS = ('pretty', 'compact')
+
+for _format in [config['output_format']] + list(config['tool_output_formats'].values()):
+    if _format is not None and _format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {_format} (expected one of {', '.join(OUTPUT_FORMATS)})")
+
+def serialize_result(result: Any, output_format: str = 'pretty') -> str:
+    """Serialize a tool result to JSON text in the given output format."""
+    if orjson is not None:
+        try:
+            option = orjson.OPT_INDENT_2 if output_format == 'pretty' else 0
+            return orjson.dumps(result, option=option).decode()
+        except TypeError:
+            pass  # e.g. non-string keys; fall back to the standard library
+    if output_format == 'pretty':
+        return json.dumps(result, indent=2, default=str)
+    return json.dumps(result, separators=(',', ':'), ensure_ascii=False, default=str)
+
+# Response shaping for record-returning tools: results larger than the byte
+# budget are cut down to the leading records that fit, with a continuation
+# (next_offset or next_cursor) so the client can fetch the rest.
+
+def _response_budget(arguments: Dict[str, Any]) -> int:
+    """Byte budget for a tool response (0 = unlimited)."""
+    budgets = [config['max_response_bytes']] if config['max_response_bytes'] > 0 else []
+    if arguments.get("max_bytes"):
+        budgets.append(int(arguments["max_bytes"]))
+    if arguments.get("max_tokens"):
+        budgets.append(int(arguments["max_tokens"]) * 4)  # ~4 bytes per token
+    return min(budgets) if budgets else 0
+
+def _continuation(arguments: Dict[str, Any], records: List[Dict[str, Any]], returned: int) -> Dict[str, Any]:
+    """Continuation fields pointing just after the first `returned` records."""
+    table_id = arguments["table_id"]
+    cursor = arguments.get("cursor")
+    if cursor or arguments.get("pagination") == "keyset":
+        key_field = NocoDBClient.decode_cursor(table_id, cursor)['key_field'] if cursor else 'Id'
+        return {'next_cursor': NocoDBClient.encode_cursor(table_id, key_field, records[returned - 1].get(key_field))}
+    return {'next_offset': arguments.get("offset", 0) + returned}
+
+def shape_response(result: Any, arguments: Dict[str, Any], output_format: str) -> str:
+    """Serialize a record-returning tool result within the response budget.
+    
+    With `summary` set, the page's records are replaced by column statistics.
+    Otherwise records are dropped from the end until the response fits, and
+    the result is marked `truncated` with a continuation for the rest.
+    """
+    records = result.get('list') if isinstance(result, dict) else None
+    if isinstance(records, list) and arguments.get("summary"):
+        aggregator = RecordAggregator()
+        for record in records:
+            aggregator.add(record)
+        result = {key: value for key, value in result.items() if key != 'list'}
+        result['summary'] = aggregator.result()
+        return serialize_result(result, output_format)
+    
+    text = serialize_result(result, output_format)
+    budget = _response_budget(arguments)
+    size = len(text.encode())
+    if not budget or size <= budget:
+        return text
+    
+    if not isinstance(records, list) or not records:
+        # Nothing to page through: return a clearly marked preview instead
+        preview = text.encode()[:budget].decode(errors='ignore')
+        return serialize_result({'truncated': True, 'size_bytes': size, 'max_bytes': budget,
+                                 'preview': preview}, output_format)
+    
+    envelope = {key: value for key, value in result.items() if key != 'list'}
+    # Measure the overhead on the envelope as it will be sent, with a sample
+    # continuation, and each record as it is laid out inside the list
+    sample = dict(envelope, truncated=True, returned_rows=len(records))
+    sample.update(_continuation(arguments, records, len(records)))
+    overhead = len(serialize_result(dict(sample, list=[]), output_format).encode())
+    keep, used = 0, overhead
+    for record in records:
+        used += len(serialize_result(dict(sample, list=[record]), output_format).encode()) - overhead + 1
+        if used > budget:
+            break
+        keep += 1
+    
+    while True:
+        returned = max(keep, 1)
+        shaped = dict(envelope, list=records[:returned], truncated=True, returned_rows=returned)
+        shaped.update(_continuation(arguments, records, returned))
+        text = serialize_result(shaped, output_format)
+        if len(text.encode()) <= budget:
+            return text
+        if returned == 1:
+            shaped['note'] = "A single record exceeds the response budget; use fields to select fewer columns"
+            return serialize_result(shaped, output_format)
+        keep = int(returned * 0.9)
+
+async def _projection(arguments: Dict[str, Any]) -> Optional[List[str]]:
+    """Fields to read for a record tool call: explicit `fields`, or the light set."""
+    if arguments.get("fields"):
+        return arguments["fields"]
+    if arguments.get("light", config['light_reads']):
+        return await nocodb_client.get_light_fields(arguments["table_id"])
+    return None
+
+# Input schema properties shared by the chunked bulk tools
+BATCH_PROPERTIES: Dict[str, Any] = {
+    "chunk_size": {
+        "type": "integer",
+        "description": "Maximum records per request (default: 100)"
+    },
+    "chunk_bytes": {
+        "type": "integer",
+        "description": "Maximum JSON size of a request body in bytes (default: 1000000)"
+    },
+    "concurrency": {
+        "type": "integer",
+        "description": "Number of chunks sent in parallel (default: 4)"
+    },
+    "chunks": {
+        "type": "array",
+        "description": "Only submit these chunk indexes, e.g. failed_chunks from a previous call with the same input and chunk settings",
+        "items": {
+            "type": "integer"
+        }
+    }
+}
+
+def _batch_options(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Chunking options of a bulk tool call, as keyword arguments for NocoDBClient."""
+    return {
+        'chunk_size': arguments.get("chunk_size"),
+        'chunk_bytes': arguments.get("chunk_bytes"),
+        'concurrency': arguments.get("concurrency"),
+        'only_chunks': arguments.get("chunks")
+    }
+
+def load_records_file(path: str) -> List[Dict[str, Any]]:
+    """Read records from a local CSV (with a header row) or NDJSON/JSON Lines file.
+    
+    Empty CSV cells are read as None, matching the nulls NoCoDB returns.
+    """
+    path = os.path.expanduser(path)
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, newline='', encoding='utf-8') as f:
+        if extension == '.csv':
+            return [
+                {column: None if value == '' else value for column, value in row.items()}
+                for row in csv.DictReader(f)
+            ]
+        if extension in ('.ndjson', '.jsonl'):
+            return [json.loads(line) for line in f if line.strip()]
+    raise ValueError(f"Unsupported records file '{path}': expected .csv, .ndjson or .jsonl")
+
+# Tool registry: each MCP tool is declared once, next to its handler. The
+# Tool definitions served by handle_list_tools, the argument validation and
+# the dispatch in handle_call_tool are all driven from TOOL_REGISTRY.
+
+def compile_validator(input_schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], None]:
+    """Build a validator that checks required arguments and array/object types."""
+    required = list(input_schema.get("required", []))
+    if not required:
+        message = ""
+    elif len(required) == 1:
+        message = f"{required[0]} is required"
+    elif len(required) == 2:
+        message = f"{required[0]} and {required[1]} are required"
+    else:
+        message = f"{', '.join(required[:-1])}, and {required[-1]} are required"
+    
+    container_types = {"array": list, "object": dict}
+    typed = {
+        name: prop["type"]
+        for name, prop in input_schema.get("properties", {}).items()
+        if prop.get("type") in container_types
+    }
+    
+    def validate(arguments: Dict[str, Any]) -> None:
+        if not all(arguments.get(name) for name in required):
+            raise ValueError(message)
+        for name, expected in typed.items():
+            value = arguments.get(name)
+            if value is not None and not isinstance(value, container_types[expected]):
+                raise ValueError(f"{name} must be an {expected}")
+    
+    return validate
+
+# Input schema property added to every tool (see handle_call_tool)
+TIMEOUT_PROPERTY: Dict[str, Any] = {
+    "type": "number",
+    "description": "Optional deadline in seconds for the whole call; requests are cut short and the call fails once it passes"
+}
+
+class ToolSpec:
+    """A registered MCP tool: its definition, argument validator and handler."""
+    
+    def __init__(self, tool: Tool, handler: Callable[[Dict[str, Any]], Awaitable[Any]],
+                 output_format: Optional[str] = None, shaped: bool = False):
+        self.tool = tool
+        self.handler = handler
+        self.shaped = shaped
+        # Every tool accepts an optional per-call deadline
+        tool.inputSchema.setdefault("properties", {}).setdefault("timeout", TIMEOUT_PROPERTY)
+        self.validate = compile_validator(tool.inputSchema)
+        # Configured per-tool format, then the global format, then the tool's default
+        self.output_format = (
+            config['tool_output_formats'].get(tool.name)
+            or config['output_format']
+            or output_format
+            or 'pretty'
+        )
+
+TOOL_REGISTRY: Dict[str, ToolSpec] = {}
+
+def register_tool(tool: Tool, output_format: Optional[str] = None, shaped: bool = False) -> Callable:
+    """Decorator registering an async handler for an MCP tool.
+    
+    `output_format` is the tool's default result format ('pretty' unless
+    given); record-heavy tools default to 'compact'. `shaped` tools have their
+    results fitted to the response budget by shape_response.
+    """
+    def decorator(handler: Callable[[Dict[str, Any]], Awaitable[Any]]) -> Callable:
+        TOOL_REGISTRY[tool.name] = ToolSpec(tool, handler, output_format, shaped)
+        return handler
+    return decorator
+
+@register_tool(
+    Tool(
+        name="list_bases",
+        description="List all bases (projects) in NoCoDB",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    )
+)
+async def _handle_list_bases(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.list_bases()
+
+@register_tool(
+    Tool(
+        name="get_base_info",
+        description="Get detailed information about a specific base",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "base_id": {
+                    "type": "string",
+                    "description": "The ID of the base to get information about"
+                }
+            },
+            "required": ["base_id"]
+        }
+    )
+)
+async def _handle_get_base_info(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.get_base_info(arguments["base_id"])
+
+@register_tool(
+    Tool(
+        name="create_base",
+        description="Create a new base (project) in NoCoDB",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "The title of the new base"
                 },
-                "required": ["base_id"]
-            }
-        ),
-        Tool(
-            name="create_base",
-            description="Create a new base (project) in NoCoDB",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "The title of the new base"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Optional description for the base"
-                    }
+                "description": {
+                    "type": "string",
+                    "description": "Optional description for the base"
+                }
+            },
+            "required": ["title"]
+        }
+    )
+)
+async def _handle_create_base(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.create_base(arguments["title"], arguments.get("description", ""))
+
+@register_tool(
+    Tool(
+        name="list_tables",
+        description="List all tables in a base",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "base_id": {
+                    "type": "string",
+                    "description": "The ID of the base to list tables from"
+                }
+            },
+            "required": ["base_id"]
+        }
+    )
+)
+async def _handle_list_tables(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.list_tables(arguments["base_id"])
+
+@register_tool(
+    Tool(
+        name="get_table_info",
+        description="Get detailed information about a table including columns and schema",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table to get information about"
+                }
+            },
+            "required": ["table_id"]
+        }
+    )
+)
+async def _handle_get_table_info(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.get_table_info(arguments["table_id"])
+
+@register_tool(
+    Tool(
+        name="create_table",
+        description="Create a new table in a base with specified columns",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "base_id": {
+                    "type": "string",
+                    "description": "The ID of the base to create the table in"
                 },
-                "required": ["title"]
-            }
-        ),
-        Tool(
-            name="list_tables",
-            description="List all tables in a base",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "base_id": {
-                        "type": "string",
-                        "description": "The ID of the base to list tables from"
-                    }
+                "title": {
+                    "type": "string",
+                    "description": "The display title of the table"
                 },
-                "required": ["base_id"]
-            }
-        ),
-        Tool(
-            name="get_table_info",
-            description="Get detailed information about a table including columns and schema",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table to get information about"
-                    }
+                "table_name": {
+                    "type": "string",
+                    "description": "The internal name of the table"
                 },
-                "required": ["table_id"]
-            }
-        ),
-        Tool(
-            name="create_table",
-            description="Create a new table in a base with specified columns",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "base_id": {
-                        "type": "string",
-                        "description": "The ID of the base to create the table in"
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "The display title of the table"
-                    },
-                    "table_name": {
-                        "type": "string",
-                        "description": "The internal name of the table"
-                    },
-                    "columns": {
-                        "type": "array",
-                        "description": "Array of column definitions",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "column_name": {"type": "string"},
-                                "title": {"type": "string"},
-                                "uidt": {"type": "string", "description": "Column type (SingleLineText, LongText, Number, etc.)"},
-                                "dt": {"type": "string", "description": "Database type"},
-                                "np": {"type": "string", "description": "Numeric precision"},
-                                "ns": {"type": "string", "description": "Numeric scale"}
-                            }
-                        }
-                    }
-                },
-                "required": ["base_id", "title", "table_name", "columns"]
-            }
-        ),
-        Tool(
-            name="delete_table",
-            description="Delete a table from a base",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table to delete"
-                    }
-                },
-                "required": ["table_id"]
-            }
-        ),
-        Tool(
-            name="create_column",
-            description="Create a new column in an existing table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table to add the column to"
-                    },
-                    "column_data": {
+                "columns": {
+                    "type": "array",
+                    "description": "Array of column definitions",
+                    "items": {
                         "type": "object",
-                        "description": "Column definition including name, type, and properties",
                         "properties": {
                             "column_name": {"type": "string"},
                             "title": {"type": "string"},
                             "uidt": {"type": "string", "description": "Column type (SingleLineText, LongText, Number, etc.)"},
                             "dt": {"type": "string", "description": "Database type"},
-                            "rqd": {"type": "boolean", "description": "Required field"}
+                            "np": {"type": "string", "description": "Numeric precision"},
+                            "ns": {"type": "string", "description": "Numeric scale"}
                         }
                     }
+                }
+            },
+            "required": ["base_id", "title", "table_name", "columns"]
+        }
+    )
+)
+async def _handle_create_table(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.create_table(
+        arguments["base_id"], arguments["title"], arguments["table_name"], arguments["columns"]
+    )
+
+@register_tool(
+    Tool(
+        name="delete_table",
+        description="Delete a table from a base",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table to delete"
+                }
+            },
+            "required": ["table_id"]
+        }
+    )
+)
+async def _handle_delete_table(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.delete_table(arguments["table_id"])
+
+@register_tool(
+    Tool(
+        name="create_column",
+        description="Create a new column in an existing table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table to add the column to"
                 },
-                "required": ["table_id", "column_data"]
-            }
-        ),
-        Tool(
-            name="update_column",
-            description="Update an existing column in a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table containing the column"
-                    },
-                    "column_id": {
-                        "type": "string",
-                        "description": "The ID of the column to update"
-                    },
-                    "column_data": {
-                        "type": "object",
-                        "description": "Updated column properties"
+                "column_data": {
+                    "type": "object",
+                    "description": "Column definition including name, type, and properties",
+                    "properties": {
+                        "column_name": {"type": "string"},
+                        "title": {"type": "string"},
+                        "uidt": {"type": "string", "description": "Column type (SingleLineText, LongText, Number, etc.)"},
+                        "dt": {"type": "string", "description": "Database type"},
+                        "rqd": {"type": "boolean", "description": "Required field"}
                     }
+                }
+            },
+            "required": ["table_id", "column_data"]
+        }
+    )
+)
+async def _handle_create_column(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.create_column(arguments["table_id"], arguments["column_data"])
+
+@register_tool(
+    Tool(
+        name="update_column",
+        description="Update an existing column in a table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table containing the column"
                 },
-                "required": ["table_id", "column_id", "column_data"]
-            }
-        ),
-        Tool(
-            name="delete_column",
-            description="Delete a column from a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table containing the column"
-                    },
-                    "column_id": {
-                        "type": "string",
-                        "description": "The ID of the column to delete"
-                    }
+                "column_id": {
+                    "type": "string",
+                    "description": "The ID of the column to update"
                 },
-                "required": ["table_id", "column_id"]
-            }
-        ),
-        Tool(
-            name="create_view",
-            description="Create a new view for a table (grid, form, gallery, kanban)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table to create the view for"
-                    },
-                    "view_data": {
-                        "type": "object",
-                        "description": "View configuration",
-                        "properties": {
-                            "title": {"type": "string", "description": "View title"},
-                            "type": {"type": "string", "enum": ["grid", "form", "gallery", "kanban"], "description": "View type"}
-                        }
-                    }
+                "column_data": {
+                    "type": "object",
+                    "description": "Updated column properties"
+                }
+            },
+            "required": ["table_id", "column_id", "column_data"]
+        }
+    )
+)
+async def _handle_update_column(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.update_column(
+        arguments["table_id"], arguments["column_id"], arguments["column_data"]
+    )
+
+@register_tool(
+    Tool(
+        name="delete_column",
+        description="Delete a column from a table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table containing the column"
                 },
-                "required": ["table_id", "view_data"]
-            }
-        ),
-        Tool(
-            name="list_views",
-            description="List all views for a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table to list views for"
-                    }
+                "column_id": {
+                    "type": "string",
+                    "description": "The ID of the column to delete"
+                }
+            },
+            "required": ["table_id", "column_id"]
+        }
+    )
+)
+async def _handle_delete_column(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.delete_column(arguments["table_id"], arguments["column_id"])
+
+@register_tool(
+    Tool(
+        name="create_view",
+        description="Create a new view for a table (grid, form, gallery, kanban)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table to create the view for"
                 },
-                "required": ["table_id"]
-            }
-        ),
-        Tool(
-            name="delete_view",
-            description="Delete a view",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "view_id": {
-                        "type": "string",
-                        "description": "The ID of the view to delete"
+                "view_data": {
+                    "type": "object",
+                    "description": "View configuration",
+                    "properties": {
+                        "title": {"type": "string", "description": "View title"},
+                        "type": {"type": "string", "enum": ["grid", "form", "gallery", "kanban"], "description": "View type"}
                     }
+                }
+            },
+            "required": ["table_id", "view_data"]
+        }
+    )
+)
+async def _handle_create_view(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.create_view(arguments["table_id"], arguments["view_data"])
+
+@register_tool(
+    Tool(
+        name="list_views",
+        description="List all views for a table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table to list views for"
+                }
+            },
+            "required": ["table_id"]
+        }
+    )
+)
+async def _handle_list_views(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.list_views(arguments["table_id"])
+
+@register_tool(
+    Tool(
+        name="delete_view",
+        description="Delete a view",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "view_id": {
+                    "type": "string",
+                    "description": "The ID of the view to delete"
+                }
+            },
+            "required": ["view_id"]
+        }
+    )
+)
+async def _handle_delete_view(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.delete_view(arguments["view_id"])
+
+@register_tool(
+    Tool(
+        name="create_filter",
+        description="Create a filter for a view",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "view_id": {
+                    "type": "string",
+                    "description": "The ID of the view to create the filter for"
                 },
-                "required": ["view_id"]
-            }
-        ),
-        Tool(
-            name="create_filter",
-            description="Create a filter for a view",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "view_id": {
-                        "type": "string",
-                        "description": "The ID of the view to create the filter for"
-                    },
-                    "filter_data": {
-                        "type": "object",
-                        "description": "Filter configuration",
-                        "properties": {
-                            "fk_column_id": {"type": "string", "description": "Column ID to filter on"},
-                            "comparison_op": {"type": "string", "description": "Comparison operator (eq, neq, like, etc.)"},
-                            "value": {"type": "string", "description": "Filter value"}
-                        }
+                "filter_data": {
+                    "type": "object",
+                    "description": "Filter configuration",
+                    "properties": {
+                        "fk_column_id": {"type": "string", "description": "Column ID to filter on"},
+                        "comparison_op": {"type": "string", "description": "Comparison operator (eq, neq, like, etc.)"},
+                        "value": {"type": "string", "description": "Filter value"}
                     }
+                }
+            },
+            "required": ["view_id", "filter_data"]
+        }
+    )
+)
+async def _handle_create_filter(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.create_filter(arguments["view_id"], arguments["filter_data"])
+
+@register_tool(
+    Tool(
+        name="list_filters",
+        description="List all filters for a view",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "view_id": {
+                    "type": "string",
+                    "description": "The ID of the view to list filters for"
+                }
+            },
+            "required": ["view_id"]
+        }
+    )
+)
+async def _handle_list_filters(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.list_filters(arguments["view_id"])
+
+@register_tool(
+    Tool(
+        name="delete_filter",
+        description="Delete a filter",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filter_id": {
+                    "type": "string",
+                    "description": "The ID of the filter to delete"
+                }
+            },
+            "required": ["filter_id"]
+        }
+    )
+)
+async def _handle_delete_filter(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.delete_filter(arguments["filter_id"])
+
+@register_tool(
+    Tool(
+        name="create_sort",
+        description="Create a sort for a view",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "view_id": {
+                    "type": "string",
+                    "description": "The ID of the view to create the sort for"
                 },
-                "required": ["view_id", "filter_data"]
-            }
-        ),
-        Tool(
-            name="list_filters",
-            description="List all filters for a view",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "view_id": {
-                        "type": "string",
-                        "description": "The ID of the view to list filters for"
+                "sort_data": {
+                    "type": "object",
+                    "description": "Sort configuration",
+                    "properties": {
+                        "fk_column_id": {"type": "string", "description": "Column ID to sort by"},
+                        "direction": {"type": "string", "enum": ["asc", "desc"], "description": "Sort direction"}
                     }
+                }
+            },
+            "required": ["view_id", "sort_data"]
+        }
+    )
+)
+async def _handle_create_sort(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.create_sort(arguments["view_id"], arguments["sort_data"])
+
+@register_tool(
+    Tool(
+        name="list_sorts",
+        description="List all sorts for a view",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "view_id": {
+                    "type": "string",
+                    "description": "The ID of the view to list sorts for"
+                }
+            },
+            "required": ["view_id"]
+        }
+    )
+)
+async def _handle_list_sorts(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.list_sorts(arguments["view_id"])
+
+@register_tool(
+    Tool(
+        name="delete_sort",
+        description="Delete a sort",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sort_id": {
+                    "type": "string",
+                    "description": "The ID of the sort to delete"
+                }
+            },
+            "required": ["sort_id"]
+        }
+    )
+)
+async def _handle_delete_sort(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.delete_sort(arguments["sort_id"])
+
+@register_tool(
+    Tool(
+        name="create_webhook",
+        description="Create a webhook for table events",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table to create the webhook for"
                 },
-                "required": ["view_id"]
-            }
-        ),
-        Tool(
-            name="delete_filter",
-            description="Delete a filter",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filter_id": {
-                        "type": "string",
-                        "description": "The ID of the filter to delete"
+                "webhook_data": {
+                    "type": "object",
+                    "description": "Webhook configuration",
+                    "properties": {
+                        "title": {"type": "string", "description": "Webhook title"},
+                        "notification": {
+                            "type": "object",
+                            "properties": {
+                                "type": {"type": "string", "enum": ["URL", "Email", "Slack", "Discord", "Teams"]},
+                                "payload": {"type": "object"}
+                            }
+                        },
+                        "event": {"type": "string", "enum": ["after", "before"], "description": "When to trigger"},
+                        "operation": {"type": "string", "enum": ["insert", "update", "delete"], "description": "Which operation to watch"}
                     }
+                }
+            },
+            "required": ["table_id", "webhook_data"]
+        }
+    )
+)
+async def _handle_create_webhook(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.create_webhook(arguments["table_id"], arguments["webhook_data"])
+
+@register_tool(
+    Tool(
+        name="list_webhooks",
+        description="List all webhooks for a table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table to list webhooks for"
+                }
+            },
+            "required": ["table_id"]
+        }
+    )
+)
+async def _handle_list_webhooks(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.list_webhooks(arguments["table_id"])
+
+@register_tool(
+    Tool(
+        name="delete_webhook",
+        description="Delete a webhook",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hook_id": {
+                    "type": "string",
+                    "description": "The ID of the webhook to delete"
+                }
+            },
+            "required": ["hook_id"]
+        }
+    )
+)
+async def _handle_delete_webhook(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.delete_webhook(arguments["hook_id"])
+
+@register_tool(
+    Tool(
+        name="test_webhook",
+        description="Test a webhook configuration",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table to test the webhook for"
                 },
-                "required": ["filter_id"]
-            }
-        ),
-        Tool(
-            name="create_sort",
-            description="Create a sort for a view",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "view_id": {
-                        "type": "string",
-                        "description": "The ID of the view to create the sort for"
-                    },
-                    "sort_data": {
-                        "type": "object",
-                        "description": "Sort configuration",
-                        "properties": {
-                            "fk_column_id": {"type": "string", "description": "Column ID to sort by"},
-                            "direction": {"type": "string", "enum": ["asc", "desc"], "description": "Sort direction"}
-                        }
-                    }
+                "webhook_data": {
+                    "type": "object",
+                    "description": "Webhook configuration to test"
+                }
+            },
+            "required": ["table_id", "webhook_data"]
+        }
+    )
+)
+async def _handle_test_webhook(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.test_webhook(arguments["table_id"], arguments["webhook_data"])
+
+@register_tool(
+    Tool(
+        name="duplicate_table",
+        description="Duplicate a table within the same base (copy_table_to_base alternative)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table to duplicate"
                 },
-                "required": ["view_id", "sort_data"]
-            }
-        ),
-        Tool(
-            name="list_sorts",
-            description="List all sorts for a view",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "view_id": {
-                        "type": "string",
-                        "description": "The ID of the view to list sorts for"
+                "options": {
+                    "type": "object",
+                    "description": "Duplication options",
+                    "properties": {
+                        "includeData": {"type": "boolean", "description": "Include table data"},
+                        "excludeHooks": {"type": "boolean", "description": "Exclude webhooks"},
+                        "excludeViews": {"type": "boolean", "description": "Exclude views"}
                     }
+                }
+            },
+            "required": ["table_id", "options"]
+        }
+    )
+)
+async def _handle_duplicate_table(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.duplicate_table(arguments["table_id"], arguments["options"])
+
+@register_tool(
+    Tool(
+        name="get_table_data",
+        description="Get data from a table with pagination, filtering and sorting",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table to get data from"
                 },
-                "required": ["view_id"]
-            }
-        ),
-        Tool(
-            name="delete_sort",
-            description="Delete a sort",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sort_id": {
-                        "type": "string",
-                        "description": "The ID of the sort to delete"
-                    }
+                "limit": {
+                    "type": "integer",
+                    "description": "Number of records to return (default: 25)"
                 },
-                "required": ["sort_id"]
-            }
-        ),
-        Tool(
-            name="create_webhook",
-            description="Create a webhook for table events",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table to create the webhook for"
-                    },
-                    "webhook_data": {
-                        "type": "object",
-                        "description": "Webhook configuration",
-                        "properties": {
-                            "title": {"type": "string", "description": "Webhook title"},
-                            "notification": {
-                                "type": "object",
-                                "properties": {
-                                    "type": {"type": "string", "enum": ["URL", "Email", "Slack", "Discord", "Teams"]},
-                                    "payload": {"type": "object"}
-                                }
-                            },
-                            "event": {"type": "string", "enum": ["after", "before"], "description": "When to trigger"},
-                            "operation": {"type": "string", "enum": ["insert", "update", "delete"], "description": "Which operation to watch"}
-                        }
-                    }
+                "offset": {
+                    "type": "integer",
+                    "description": "Number of records to skip (default: 0)"
                 },
-                "required": ["table_id", "webhook_data"]
-            }
-        ),
-        Tool(
-            name="list_webhooks",
-            description="List all webhooks for a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table to list webhooks for"
-                    }
+                "pagination": {
+                    "type": "string",
+                    "description": "Pagination mode: 'offset' (default) or 'keyset', which pages by Id and returns a next_cursor that stays fast on large tables",
+                    "enum": ["offset", "keyset"]
                 },
-                "required": ["table_id"]
-            }
-        ),
-        Tool(
-            name="delete_webhook",
-            description="Delete a webhook",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hook_id": {
-                        "type": "string",
-                        "description": "The ID of the webhook to delete"
-                    }
+                "cursor": {
+                    "type": "string",
+                    "description": "Continuation token (next_cursor) from a previous keyset page; implies keyset pagination"
                 },
-                "required": ["hook_id"]
-            }
-        ),
-        Tool(
-            name="test_webhook",
-            description="Test a webhook configuration",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table to test the webhook for"
-                    },
-                    "webhook_data": {
-                        "type": "object",
-                        "description": "Webhook configuration to test"
+                "fields": {
+                    "type": "array",
+                    "description": "Fields to return (default: all fields)",
+                    "items": {
+                        "type": "string"
                     }
                 },
-                "required": ["table_id", "webhook_data"]
-            }
-        ),
-        Tool(
-            name="duplicate_table",
-            description="Duplicate a table within the same base (copy_table_to_base alternative)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table to duplicate"
-                    },
-                    "options": {
-                        "type": "object",
-                        "description": "Duplication options",
-                        "properties": {
-                            "includeData": {"type": "boolean", "description": "Include table data"},
-                            "excludeHooks": {"type": "boolean", "description": "Exclude webhooks"},
-                            "excludeViews": {"type": "boolean", "description": "Exclude views"}
-                        }
-                    }
+                "light": {
+                    "type": "boolean",
+                    "description": "Leave out large fields (LongText, JSON, Attachment, links, ...) when fields is not given"
                 },
-                "required": ["table_id", "options"]
-            }
-        ),
-        Tool(
-            name="get_table_data",
-            description="Get data from a table with pagination",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table to get data from"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of records to return (default: 25)"
-                    },
-                    "offset": {
-                        "type": "integer",
-                        "description": "Number of records to skip (default: 0)"
-                    }
+                "where": {
+                    "type": "string",
+                    "description": "Optional filter evaluated by the database, e.g. (Status,eq,Done)~and(Amount,gt,100)"
                 },
-                "required": ["table_id"]
-            }
-        ),
-        Tool(
-            name="create_record",
-            description="Create a new record in a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table to create a record in"
-                    },
-                    "data": {
-                        "type": "object",
-                        "description": "The data for the new record as key-value pairs"
-                    }
+                "sort": {
+                    "type": "string",
+                    "description": "Optional comma-separated sort fields, prefix with - for descending, e.g. -CreatedAt,Title (offset pagination only)"
                 },
-                "required": ["table_id", "data"]
-            }
-        ),
-        Tool(
-            name="update_record",
-            description="Update an existing record in a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table containing the record"
-                    },
-                    "record_id": {
-                        "type": "string",
-                        "description": "The ID of the record to update"
-                    },
-                    "data": {
-                        "type": "object",
-                        "description": "The updated data as key-value pairs"
-                    }
+                "view_id": {
+                    "type": "string",
+                    "description": "Optional view whose filters and sorts are applied"
                 },
-                "required": ["table_id", "record_id", "data"]
-            }
-        ),
-        Tool(
-            name="delete_record",
-            description="Delete a record from a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table containing the record"
-                    },
-                    "record_id": {
-                        "type": "string",
-                        "description": "The ID of the record to delete"
+                "max_bytes": {
+                    "type": "integer",
+                    "description": "Maximum response size in bytes; larger pages are truncated and return next_offset/next_cursor"
+                },
+                "max_tokens": {
+                    "type": "integer",
+                    "description": "Maximum response size in tokens (approximately 4 bytes each)"
+                },
+                "summary": {
+                    "type": "boolean",
+                    "description": "Return row count and column statistics for the page instead of the raw records"
+                }
+            },
+            "required": ["table_id"]
+        }
+    ),
+    output_format="compact",
+    shaped=True
+)
+async def _handle_get_table_data(arguments: Dict[str, Any]) -> Any:
+    table_id = arguments["table_id"]
+    limit = arguments.get("limit", 25)
+    cursor = arguments.get("cursor")
+    fields = await _projection(arguments)
+    where = arguments.get("where")
+    view_id = arguments.get("view_id")
+    if cursor or arguments.get("pagination") == "keyset":
+        if arguments.get("sort"):
+            raise ValueError("sort cannot be combined with keyset pagination, which always sorts by Id")
+        return await nocodb_client.get_table_data_keyset(
+            table_id, limit, cursor, fields=fields, where=where, view_id=view_id
+        )
+    return await nocodb_client.get_table_data(
+        table_id, limit, arguments.get("offset", 0), fields=fields, where=where,
+        sort=arguments.get("sort"), view_id=view_id
+    )
+
+@register_tool(
+    Tool(
+        name="aggregate_table_data",
+        description="Stream every record of a table page by page and return per-column statistics (counts, nulls, distinct values, numeric min/max/sum/avg) and optional group counts",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table to aggregate"
+                },
+                "fields": {
+                    "type": "array",
+                    "description": "Optional list of fields to read (default: all fields)",
+                    "items": {
+                        "type": "string"
                     }
                 },
-                "required": ["table_id", "record_id"]
-            }
-        ),
-        Tool(
-            name="get_record",
-            description="Get a specific record from a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table"
-                    },
-                    "record_id": {
-                        "type": "string",
-                        "description": "The ID of the record to retrieve"
+                "where": {
+                    "type": "string",
+                    "description": "Optional WHERE clause for filtering records, e.g. (Status,eq,Done)"
+                },
+                "group_by": {
+                    "type": "string",
+                    "description": "Optional field to count records by"
+                },
+                "page_size": {
+                    "type": "integer",
+                    "description": "Number of records fetched per page (default: 200)"
+                },
+                "concurrency": {
+                    "type": "integer",
+                    "description": "Number of pages fetched in parallel (default: 1, e.g. 4-16 for large tables)"
+                },
+                "pagination": {
+                    "type": "string",
+                    "description": "Pagination mode: 'offset' (default) or 'keyset', which pages by Id and keeps late pages fast (sequential only)",
+                    "enum": ["offset", "keyset"]
+                }
+            },
+            "required": ["table_id"]
+        }
+    )
+)
+async def _handle_aggregate_table_data(arguments: Dict[str, Any]) -> Any:
+    fields = arguments.get("fields")
+    group_by = arguments.get("group_by")
+    if fields and group_by and group_by not in fields:
+        fields = fields + [group_by]
+    
+    aggregator = RecordAggregator(group_by)
+    records = nocodb_client.iter_records(
+        arguments["table_id"],
+        arguments.get("page_size", 200),
+        fields=fields,
+        where=arguments.get("where"),
+        concurrency=arguments.get("concurrency", 1),
+        keyset=arguments.get("pagination") == "keyset"
+    )
+    async for record in records:
+        aggregator.add(record)
+    return aggregator.result()
+
+@register_tool(
+    Tool(
+        name="create_record",
+        description="Create a new record in a table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table to create a record in"
+                },
+                "data": {
+                    "type": "object",
+                    "description": "The data for the new record as key-value pairs"
+                }
+            },
+            "required": ["table_id", "data"]
+        }
+    )
+)
+async def _handle_create_record(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.create_record(arguments["table_id"], arguments["data"])
+
+@register_tool(
+    Tool(
+        name="update_record",
+        description="Update an existing record in a table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table containing the record"
+                },
+                "record_id": {
+                    "type": "string",
+                    "description": "The ID of the record to update"
+                },
+                "data": {
+                    "type": "object",
+                    "description": "The updated data as key-value pairs"
+                }
+            },
+            "required": ["table_id", "record_id", "data"]
+        }
+    )
+)
+async def _handle_update_record(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.update_record(
+        arguments["table_id"], arguments["record_id"], arguments["data"]
+    )
+
+@register_tool(
+    Tool(
+        name="delete_record",
+        description="Delete a record from a table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table containing the record"
+                },
+                "record_id": {
+                    "type": "string",
+                    "description": "The ID of the record to delete"
+                }
+            },
+            "required": ["table_id", "record_id"]
+        }
+    )
+)
+async def _handle_delete_record(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.delete_record(arguments["table_id"], arguments["record_id"])
+
+@register_tool(
+    Tool(
+        name="get_record",
+        description="Get a specific record from a table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table"
+                },
+                "record_id": {
+                    "type": "string",
+                    "description": "The ID of the record to retrieve"
+                },
+                "fields": {
+                    "type": "array",
+                    "description": "Fields to return (default: all fields)",
+                    "items": {
+                        "type": "string"
                     }
                 },
-                "required": ["table_id", "record_id"]
-            }
-        ),
-        Tool(
-            name="bulk_insert_records",
-            description="Bulk insert multiple records into a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table"
-                    },
-                    "records": {
-                        "type": "array",
-                        "description": "Array of record objects to insert",
-                        "items": {
-                            "type": "object"
-                        }
+                "light": {
+                    "type": "boolean",
+                    "description": "Leave out large fields (LongText, JSON, Attachment, links, ...) when fields is not given"
+                }
+            },
+            "required": ["table_id", "record_id"]
+        }
+    )
+)
+async def _handle_get_record(arguments: Dict[str, Any]) -> Any:
+    fields = await _projection(arguments)
+    return await nocodb_client.get_record(arguments["table_id"], arguments["record_id"], fields=fields)
+
+@register_tool(
+    Tool(
+        name="bulk_insert_records",
+        description="Bulk insert multiple records into a table. Large inputs are split into chunks sent in parallel; failed chunks are reported by index and can be retried with the chunks argument",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table"
+                },
+                "records": {
+                    "type": "array",
+                    "description": "Array of record objects to insert",
+                    "items": {
+                        "type": "object"
                     }
                 },
-                "required": ["table_id", "records"]
-            }
-        ),
-        Tool(
-            name="bulk_update_records",
-            description="Bulk update multiple records in a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table"
-                    },
-                    "records": {
-                        "type": "array",
-                        "description": "Array of record objects to update (must include record IDs)",
-                        "items": {
-                            "type": "object"
-                        }
+                **BATCH_PROPERTIES
+            },
+            "required": ["table_id", "records"]
+        }
+    ),
+    output_format="compact"
+)
+async def _handle_bulk_insert_records(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.bulk_insert_records(
+        arguments["table_id"], arguments["records"], **_batch_options(arguments)
+    )
+
+@register_tool(
+    Tool(
+        name="bulk_update_records",
+        description="Bulk update multiple records in a table. Large inputs are split into chunks sent in parallel; failed rows are reported and their chunks can be retried with the chunks argument",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table"
+                },
+                "records": {
+                    "type": "array",
+                    "description": "Array of record objects to update (must include record IDs)",
+                    "items": {
+                        "type": "object"
                     }
                 },
-                "required": ["table_id", "records"]
-            }
-        ),
-        Tool(
-            name="bulk_delete_records",
-            description="Bulk delete multiple records from a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table"
-                    },
-                    "record_ids": {
-                        "type": "array",
-                        "description": "Array of record IDs to delete",
-                        "items": {
-                            "type": "string"
-                        }
+                **BATCH_PROPERTIES
+            },
+            "required": ["table_id", "records"]
+        }
+    ),
+    output_format="compact"
+)
+async def _handle_bulk_update_records(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.bulk_update_records(
+        arguments["table_id"], arguments["records"], **_batch_options(arguments)
+    )
+
+@register_tool(
+    Tool(
+        name="bulk_delete_records",
+        description="Bulk delete multiple records from a table. Large inputs are split into chunks sent in parallel; failed rows are reported and their chunks can be retried with the chunks argument",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table"
+                },
+                "record_ids": {
+                    "type": "array",
+                    "description": "Array of record IDs to delete",
+                    "items": {
+                        "type": "string"
                     }
                 },
-                "required": ["table_id", "record_ids"]
-            }
-        ),
-        Tool(
-            name="get_table_schema",
-            description="Get complete schema information for a table including columns, relations, etc.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table"
+                **BATCH_PROPERTIES
+            },
+            "required": ["table_id", "record_ids"]
+        }
+    ),
+    output_format="compact"
+)
+async def _handle_bulk_delete_records(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.bulk_delete_records(
+        arguments["table_id"], arguments["record_ids"], **_batch_options(arguments)
+    )
+
+@register_tool(
+    Tool(
+        name="upsert_records",
+        description="Insert or update records matched on a key column. Existing rows are looked up in batches, then matched records are bulk updated and the rest bulk inserted",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table"
+                },
+                "records": {
+                    "type": "array",
+                    "description": "Array of record objects, each with a value for the key column",
+                    "items": {
+                        "type": "object"
                     }
                 },
-                "required": ["table_id"]
-            }
-        ),
-        Tool(
-            name="export_table_data",
-            description="Export table data in various formats (csv, excel, json)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table"
-                    },
-                    "export_type": {
-                        "type": "string",
-                        "description": "Export format: csv, excel, or json",
-                        "enum": ["csv", "excel", "json"],
-                        "default": "csv"
+                "key": {
+                    "type": "string",
+                    "description": "Column whose value identifies a record, e.g. an external ID or email"
+                },
+                "chunk_size": BATCH_PROPERTIES["chunk_size"],
+                "chunk_bytes": BATCH_PROPERTIES["chunk_bytes"],
+                "concurrency": BATCH_PROPERTIES["concurrency"]
+            },
+            "required": ["table_id", "records", "key"]
+        }
+    ),
+    output_format="compact"
+)
+async def _handle_upsert_records(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.upsert_records(
+        arguments["table_id"], arguments["records"], arguments["key"],
+        chunk_size=arguments.get("chunk_size"),
+        chunk_bytes=arguments.get("chunk_bytes"),
+        concurrency=arguments.get("concurrency")
+    )
+
+@register_tool(
+    Tool(
+        name="sync_table",
+        description="Make a table match a desired record set keyed on a column, writing only inserted, changed and (optionally) removed rows through the bulk endpoints",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table"
+                },
+                "key": {
+                    "type": "string",
+                    "description": "Column whose value identifies a record, e.g. an external ID"
+                },
+                "records": {
+                    "type": "array",
+                    "description": "Desired records, each with a value for the key column (alternative to file_path)",
+                    "items": {
+                        "type": "object"
                     }
                 },
-                "required": ["table_id"]
-            }
-        ),
-        Tool(
-            name="get_table_count",
-            description="Get the count of records in a table with optional filtering",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_id": {
-                        "type": "string",
-                        "description": "The ID of the table"
-                    },
-                    "where": {
-                        "type": "string",
-                        "description": "Optional WHERE clause for filtering records"
+                "file_path": {
+                    "type": "string",
+                    "description": "Local .csv (with header row) or .ndjson/.jsonl file with the desired records (alternative to records)"
+                },
+                "delete_missing": {
+                    "type": "boolean",
+                    "description": "Delete rows whose key is not in the desired set (default: true)",
+                    "default": True
+                },
+                "dry_run": {
+                    "type": "boolean",
+                    "description": "Only report the planned inserts, updates and deletes (default: false)",
+                    "default": False
+                },
+                "allow_empty": {
+                    "type": "boolean",
+                    "description": "Allow an empty desired record set, which with delete_missing deletes every row (default: false)",
+                    "default": False
+                },
+                "chunk_size": BATCH_PROPERTIES["chunk_size"],
+                "chunk_bytes": BATCH_PROPERTIES["chunk_bytes"],
+                "concurrency": BATCH_PROPERTIES["concurrency"]
+            },
+            "required": ["table_id", "key"]
+        }
+    ),
+    output_format="compact"
+)
+async def _handle_sync_table(arguments: Dict[str, Any]) -> Any:
+    if ("records" in arguments) == ("file_path" in arguments):
+        raise ValueError("Exactly one of records and file_path is required")
+    records = arguments.get("records")
+    if records is None:
+        records = load_records_file(arguments["file_path"])
+    return await nocodb_client.sync_table(
+        arguments["table_id"], records, arguments["key"],
+        delete_missing=arguments.get("delete_missing", True),
+        dry_run=arguments.get("dry_run", False),
+        chunk_size=arguments.get("chunk_size"),
+        chunk_bytes=arguments.get("chunk_bytes"),
+        concurrency=arguments.get("concurrency"),
+        allow_empty=arguments.get("allow_empty", False)
+    )
+
+@register_tool(
+    Tool(
+        name="get_table_schema",
+        description="Get complete schema information for a table including columns, relations, etc.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table"
+                }
+            },
+            "required": ["table_id"]
+        }
+    )
+)
+async def _handle_get_table_schema(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.get_table_schema(arguments["table_id"])
+
+@register_tool(
+    Tool(
+        name="export_table_data",
+        description="Export table data in various formats (csv, excel, json). The export is streamed to a local file and the file's path, size and SHA-256 checksum are returned; set inline to return the content instead",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table"
+                },
+                "export_type": {
+                    "type": "string",
+                    "description": "Export format: csv, excel, or json",
+                    "enum": ["csv", "excel", "json"],
+                    "default": "csv"
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "Local file to write the export to (default: a timestamped file in NOCODB_EXPORT_DIR)"
+                },
+                "inline": {
+                    "type": "boolean",
+                    "description": "Return the export content in the response instead of writing a file: JSON parsed, CSV as text, Excel base64-encoded (default: false)",
+                    "default": False
+                },
+                "max_bytes": {
+                    "type": "integer",
+                    "description": "Maximum response size in bytes for inline exports; larger exports are truncated"
+                }
+            },
+            "required": ["table_id"]
+        }
+    ),
+    output_format="compact",
+    shaped=True
+)
+async def _handle_export_table_data(arguments: Dict[str, Any]) -> Any:
+    export_type = arguments.get("export_type", "csv")
+    if arguments.get("inline"):
+        return await nocodb_client.export_table_data(arguments["table_id"], export_type)
+    return await nocodb_client.export_table_data_to_file(
+        arguments["table_id"], export_type, arguments.get("output_path")
+    )
+
+@register_tool(
+    Tool(
+        name="export_records",
+        description="Export records page by page to a local NDJSON, CSV or Parquet file with constant memory use, returning the file's path, row count, size and SHA-256 checksum. Sends progress notifications when the client asks for them",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table"
+                },
+                "format": {
+                    "type": "string",
+                    "description": "Output format: ndjson, csv or parquet (parquet requires pyarrow)",
+                    "enum": ["ndjson", "csv", "parquet"],
+                    "default": "ndjson"
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "Local file to write (default: a timestamped file in NOCODB_EXPORT_DIR)"
+                },
+                "fields": {
+                    "type": "array",
+                    "description": "Optional list of fields to export (default: all non-system fields)",
+                    "items": {
+                        "type": "string"
                     }
                 },
-                "required": ["table_id"]
-            }
-        ),
-    ]
+                "where": {
+                    "type": "string",
+                    "description": "Optional WHERE clause for filtering records, e.g. (Status,eq,Done)"
+                },
+                "compression": {
+                    "type": "string",
+                    "description": "Optional compression: gzip for ndjson/csv; snappy (default), gzip, zstd or brotli for parquet",
+                    "enum": ["gzip", "snappy", "zstd", "brotli"]
+                },
+                "row_group_size": {
+                    "type": "integer",
+                    "description": "Records buffered and written per batch / Parquet row group (default: 10000)"
+                },
+                "page_size": {
+                    "type": "integer",
+                    "description": "Number of records fetched per page (default: 200)"
+                },
+                "concurrency": {
+                    "type": "integer",
+                    "description": "Number of pages fetched in parallel (default: 1)"
+                },
+                "pagination": {
+                    "type": "string",
+                    "description": "Pagination mode: 'offset' (default) or 'keyset', which pages by Id and keeps late pages fast (sequential only)",
+                    "enum": ["offset", "keyset"]
+                }
+            },
+            "required": ["table_id"]
+        }
+    )
+)
+async def _handle_export_records(arguments: Dict[str, Any]) -> Any:
+    progress = None
+    try:
+        context = server.request_context
+    except LookupError:
+        context = None
+    token = context.meta.progressToken if context is not None and context.meta is not None else None
+    if token is not None:
+        async def progress(rows: int, total: Optional[int]) -> None:
+            await context.session.send_progress_notification(token, rows, total)
+    
+    return await nocodb_client.export_records(
+        arguments["table_id"],
+        arguments.get("format", "ndjson"),
+        arguments.get("output_path"),
+        fields=arguments.get("fields"),
+        where=arguments.get("where"),
+        page_size=arguments.get("page_size", 200),
+        concurrency=arguments.get("concurrency", 1),
+        keyset=arguments.get("pagination") == "keyset",
+        row_group_size=arguments.get("row_group_size", 10000),
+        compression=arguments.get("compression"),
+        progress=progress
+    )
+
+@register_tool(
+    Tool(
+        name="get_table_count",
+        description="Get the count of records in a table with optional filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_id": {
+                    "type": "string",
+                    "description": "The ID of the table"
+                },
+                "where": {
+                    "type": "string",
+                    "description": "Optional WHERE clause for filtering records"
+                },
+                "view_id": {
+                    "type": "string",
+                    "description": "Optional view whose filters are applied"
+                }
+            },
+            "required": ["table_id"]
+        }
+    )
+)
+async def _handle_get_table_count(arguments: Dict[str, Any]) -> Any:
+    return await nocodb_client.get_table_count(
+        arguments["table_id"], arguments.get("where"), arguments.get("view_id")
+    )
+
+@register_tool(
+    Tool(
+        name="get_client_stats",
+        description="Get client-side diagnostics such as metadata cache hit/miss counters",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    )
+)
+async def _handle_get_client_stats(arguments: Dict[str, Any]) -> Any:
+    return nocodb_client.get_stats()
+
+@server.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List available NoCoDB tools."""
+    return [spec.tool for spec in TOOL_REGISTRY.values()]
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool calls for NoCoDB operations."""
     try:
-        if name == "list_bases":
-            result = await nocodb_client.list_bases()
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "get_base_info":
-            base_id = arguments.get("base_id")
-            if not base_id:
-                raise ValueError("base_id is required")
-            result = await nocodb_client.get_base_info(base_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "list_tables":
-            base_id = arguments.get("base_id")
-            if not base_id:
-                raise ValueError("base_id is required")
-            result = await nocodb_client.list_tables(base_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "get_table_info":
-            table_id = arguments.get("table_id")
-            if not table_id:
-                raise ValueError("table_id is required")
-            result = await nocodb_client.get_table_info(table_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "create_base":
-            title = arguments.get("title")
-            description = arguments.get("description", "")
-            if not title:
-                raise ValueError("title is required")
-            result = await nocodb_client.create_base(title, description)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "create_table":
-            base_id = arguments.get("base_id")
-            title = arguments.get("title")
-            table_name = arguments.get("table_name")
-            columns = arguments.get("columns")
-            
-            if not all([base_id, title, table_name, columns]):
-                raise ValueError("base_id, title, table_name, and columns are required")
-            
-            result = await nocodb_client.create_table(base_id, title, table_name, columns)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "delete_table":
-            table_id = arguments.get("table_id")
-            if not table_id:
-                raise ValueError("table_id is required")
-            result = await nocodb_client.delete_table(table_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "create_column":
-            table_id = arguments.get("table_id")
-            column_data = arguments.get("column_data")
-            
-            if not all([table_id, column_data]):
-                raise ValueError("table_id and column_data are required")
-            
-            result = await nocodb_client.create_column(table_id, column_data)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "update_column":
-            table_id = arguments.get("table_id")
-            column_id = arguments.get("column_id")
-            column_data = arguments.get("column_data")
-            
-            if not all([table_id, column_id, column_data]):
-                raise ValueError("table_id, column_id, and column_data are required")
-            
-            result = await nocodb_client.update_column(table_id, column_id, column_data)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "delete_column":
-            table_id = arguments.get("table_id")
-            column_id = arguments.get("column_id")
-            
-            if not all([table_id, column_id]):
-                raise ValueError("table_id and column_id are required")
-            
-            result = await nocodb_client.delete_column(table_id, column_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "create_view":
-            table_id = arguments.get("table_id")
-            view_data = arguments.get("view_data")
-            
-            if not all([table_id, view_data]):
-                raise ValueError("table_id and view_data are required")
-            
-            result = await nocodb_client.create_view(table_id, view_data)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "list_views":
-            table_id = arguments.get("table_id")
-            if not table_id:
-                raise ValueError("table_id is required")
-            result = await nocodb_client.list_views(table_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "delete_view":
-            view_id = arguments.get("view_id")
-            if not view_id:
-                raise ValueError("view_id is required")
-            result = await nocodb_client.delete_view(view_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "create_filter":
-            view_id = arguments.get("view_id")
-            filter_data = arguments.get("filter_data")
-            
-            if not all([view_id, filter_data]):
-                raise ValueError("view_id and filter_data are required")
-            
-            result = await nocodb_client.create_filter(view_id, filter_data)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "list_filters":
-            view_id = arguments.get("view_id")
-            if not view_id:
-                raise ValueError("view_id is required")
-            result = await nocodb_client.list_filters(view_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "delete_filter":
-            filter_id = arguments.get("filter_id")
-            if not filter_id:
-                raise ValueError("filter_id is required")
-            result = await nocodb_client.delete_filter(filter_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "create_sort":
-            view_id = arguments.get("view_id")
-            sort_data = arguments.get("sort_data")
-            
-            if not all([view_id, sort_data]):
-                raise ValueError("view_id and sort_data are required")
-            
-            result = await nocodb_client.create_sort(view_id, sort_data)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "list_sorts":
-            view_id = arguments.get("view_id")
-            if not view_id:
-                raise ValueError("view_id is required")
-            result = await nocodb_client.list_sorts(view_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "delete_sort":
-            sort_id = arguments.get("sort_id")
-            if not sort_id:
-                raise ValueError("sort_id is required")
-            result = await nocodb_client.delete_sort(sort_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "create_webhook":
-            table_id = arguments.get("table_id")
-            webhook_data = arguments.get("webhook_data")
-            
-            if not all([table_id, webhook_data]):
-                raise ValueError("table_id and webhook_data are required")
-            
-            result = await nocodb_client.create_webhook(table_id, webhook_data)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "list_webhooks":
-            table_id = arguments.get("table_id")
-            if not table_id:
-                raise ValueError("table_id is required")
-            result = await nocodb_client.list_webhooks(table_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "delete_webhook":
-            hook_id = arguments.get("hook_id")
-            if not hook_id:
-                raise ValueError("hook_id is required")
-            result = await nocodb_client.delete_webhook(hook_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "test_webhook":
-            table_id = arguments.get("table_id")
-            webhook_data = arguments.get("webhook_data")
-            
-            if not all([table_id, webhook_data]):
-                raise ValueError("table_id and webhook_data are required")
-            
-            result = await nocodb_client.test_webhook(table_id, webhook_data)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "duplicate_table":
-            table_id = arguments.get("table_id")
-            options = arguments.get("options")
-            
-            if not all([table_id, options]):
-                raise ValueError("table_id and options are required")
-            
-            result = await nocodb_client.duplicate_table(table_id, options)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "get_table_data":
-            table_id = arguments.get("table_id")
-            limit = arguments.get("limit", 25)
-            offset = arguments.get("offset", 0)
-            
-            if not table_id:
-                raise ValueError("table_id is required")
-            
-            result = await nocodb_client.get_table_data(table_id, limit, offset)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "create_record":
-            table_id = arguments.get("table_id")
-            data = arguments.get("data")
-            
-            if not table_id or not data:
-                raise ValueError("table_id and data are required")
-            
-            result = await nocodb_client.create_record(table_id, data)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "update_record":
-            table_id = arguments.get("table_id")
-            record_id = arguments.get("record_id")
-            data = arguments.get("data")
-            
-            if not all([table_id, record_id, data]):
-                raise ValueError("table_id, record_id, and data are required")
-            
-            result = await nocodb_client.update_record(table_id, record_id, data)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "delete_record":
-            table_id = arguments.get("table_id")
-            record_id = arguments.get("record_id")
-            
-            if not all([table_id, record_id]):
-                raise ValueError("table_id and record_id are required")
-            
-            result = await nocodb_client.delete_record(table_id, record_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "get_record":
-            table_id = arguments.get("table_id")
-            record_id = arguments.get("record_id")
-            
-            if not all([table_id, record_id]):
-                raise ValueError("table_id and record_id are required")
-            
-            result = await nocodb_client.get_record(table_id, record_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "bulk_insert_records":
-            table_id = arguments.get("table_id")
-            records = arguments.get("records")
-            
-            if not table_id or not records:
-                raise ValueError("table_id and records are required")
-            
-            result = await nocodb_client.bulk_insert_records(table_id, records)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "bulk_update_records":
-            table_id = arguments.get("table_id")
-            records = arguments.get("records")
-            
-            if not table_id or not records:
-                raise ValueError("table_id and records are required")
-            
-            result = await nocodb_client.bulk_update_records(table_id, records)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "bulk_delete_records":
-            table_id = arguments.get("table_id")
-            record_ids = arguments.get("record_ids")
-            
-            if not table_id or not record_ids:
-                raise ValueError("table_id and record_ids are required")
-            
-            result = await nocodb_client.bulk_delete_records(table_id, record_ids)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "get_table_schema":
-            table_id = arguments.get("table_id")
-            
-            if not table_id:
-                raise ValueError("table_id is required")
-            
-            result = await nocodb_client.get_table_schema(table_id)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "export_table_data":
-            table_id = arguments.get("table_id")
-            export_type = arguments.get("export_type", "csv")
-            
-            if not table_id:
-                raise ValueError("table_id is required")
-            
-            result = await nocodb_client.export_table_data(table_id, export_type)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "get_table_count":
-            table_id = arguments.get("table_id")
-            where = arguments.get("where")
-            
-            if not table_id:
-                raise ValueError("table_id is required")
-            
-            result = await nocodb_client.get_table_count(table_id, where)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        else:
+        spec = TOOL_REGISTRY.get(name)
+        if spec is None:
             raise ValueError(f"Unknown tool: {name}")
+        arguments = arguments or {}
+        spec.validate(arguments)
+        timeout = arguments.get("timeout")
+        token = current_deadline.set(time.monotonic() + timeout) if timeout else None
+        try:
+            result = await asyncio.wait_for(spec.handler(arguments), timeout or None)
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(f"{name} did not finish within its {timeout}s deadline")
+        finally:
+            if token is not None:
+                current_deadline.reset(token)
+        if spec.shaped:
+            text = shape_response(result, arguments, spec.output_format)
+        else:
+            text = serialize_result(result, spec.output_format)
+        return [TextContent(type="text", text=text)]
     
+    except asyncio.CancelledError:
+        # Cancelled by the MCP client; the cancellation has already reached every
+        # request, page prefetch and bulk chunk started by the call
+        logger.info(f"Tool call {name} cancelled")
+        raise
+    except CircuitOpenError as e:
+        # Expected while NoCoDB is down; fail fast without a full error log
+        logger.warning(f"Tool call {name} rejected: {e}")
+        return [TextContent(type="text", text=f"Error: {str(e)}")]
     except Exception as e:
         logger.error(f"Tool call error: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="nocodb-mcp",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="nocodb-mcp",
+                    server_version="1.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        await nocodb_client.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark HTTP/1.1 vs HTTP/2 throughput of NocoDBClient.
+
+Starts a local stand-in for NoCoDB that speaks both HTTP/1.1 and cleartext
+HTTP/2 (prior knowledge) on the same port, answers every request with a small
+record payload after a fixed simulated upstream latency, and then drives
+`NocoDBClient.get_record` at 1, 8 and 64 concurrent requests in each mode.
+
+Like the other scripts in this directory, it imports the server module and so
+needs the configuration files to be present; no requests are sent to the
+configured host.
+
+Usage:
+    pip install 'nocodb-data-mcp[http2]'
+    python testing/benchmark_http2.py [--requests 512] [--latency-ms 20]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+import httpx
+import h2.config
+import h2.connection
+import h2.events
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from nocodb_mcp.server import NocoDBClient
+
+H2_PREFACE = b'PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n'
+RESPONSE_BODY = json.dumps({'Id': 1, 'Title': 'Benchmark record', 'Status': 'Todo'}).encode()
+
+
+class StandInServer:
+    """Minimal NoCoDB stand-in serving HTTP/1.1 and h2c on one port."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.connections = 0
+        self._server = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            head = await reader.readexactly(len(H2_PREFACE))
+            if head == H2_PREFACE:
+                await self._serve_h2(head, reader, writer)
+            else:
+                await self._serve_http1(head, reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_http1(self, head: bytes, reader: asyncio.StreamReader,
+                           writer: asyncio.StreamWriter) -> None:
+        buffer = head
+        while True:
+            while b'\r\n\r\n' not in buffer:
+                data = await reader.read(65536)
+                if not data:
+                    return
+                buffer += data
+            _, buffer = buffer.split(b'\r\n\r\n', 1)
+            await asyncio.sleep(self.latency)
+            writer.write(
+                b'HTTP/1.1 200 OK\r\n'
+                b'Content-Type: application/json\r\n'
+                b'Content-Length: ' + str(len(RESPONSE_BODY)).encode() + b'\r\n'
+                b'Connection: keep-alive\r\n\r\n' + RESPONSE_BODY
+            )
+            await writer.drain()
+
+    async def _serve_h2(self, head: bytes, reader: asyncio.StreamReader,
+                        writer: asyncio.StreamWriter) -> None:
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        pending = set()
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(self.latency)
+            conn.send_headers(stream_id, [
+                (':status', '200'),
+                ('content-type', 'application/json'),
+                ('content-length', str(len(RESPONSE_BODY))),
+            ])
+            conn.send_data(stream_id, RESPONSE_BODY, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        data = head
+        try:
+            while data:
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        task = asyncio.ensure_future(respond(event.stream_id))
+                        pending.add(task)
+                        task.add_done_callback(pending.discard)
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+                writer.write(conn.data_to_send())
+                await writer.drain()
+                data = await reader.read(65536)
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+async def run_load(client: NocoDBClient, total: int, concurrency: int) -> float:
+    """Issue `total` get_record calls with at most `concurrency` in flight; return req/s."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            await client.get_record('bench_table', str(i))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return total / (time.perf_counter() - start)
+
+
+async def benchmark(total: int, latency_ms: float, max_connections: int) -> None:
+    server = StandInServer(latency_ms / 1000.0)
+    port = await server.start()
+    base_url = f'http://127.0.0.1:{port}'
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+
+    modes = {
+        'HTTP/1.1': lambda: NocoDBClient(
+            base_url, 'token', 'cf-id', 'cf-secret',
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        ),
+        # Cleartext stand-in server, so use h2 prior knowledge instead of ALPN.
+        'HTTP/2': lambda: NocoDBClient(
+            base_url, 'token', 'cf-id', 'cf-secret', http2=True,
+            transport=httpx.AsyncHTTPTransport(http1=False, http2=True, limits=limits)
+        ),
+    }
+
+    print(f"{total} requests per run, {latency_ms:.0f} ms simulated latency, "
+          f"max {max_connections} HTTP/1.1 connections\n")
+    print(f"{'mode':<10}{'concurrency':>12}{'req/s':>12}{'connections':>14}")
+    try:
+        for concurrency in (1, 8, 64):
+            for mode, factory in modes.items():
+                client = factory()
+                server.connections = 0
+                try:
+                    await run_load(client, min(concurrency * 4, 16), concurrency)  # warm-up
+                    rate = await run_load(client, total, concurrency)
+                finally:
+                    await client.aclose()
+                print(f"{mode:<10}{concurrency:>12}{rate:>12.1f}{server.connections:>14}")
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=512, help='requests per run (default: 512)')
+    parser.add_argument('--latency-ms', type=float, default=20.0,
+                        help='simulated upstream latency per request (default: 20)')
+    parser.add_argument('--max-connections', type=int, default=20,
+                        help='HTTP/1.1 pool size, as in NOCODB_MAX_CONNECTIONS (default: 20)')
+    args = parser.parse_args()
+    asyncio.run(benchmark(args.requests, args.latency_ms, args.max_connections))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Offline regression checks for NocoDBClient.
+
+Each check drives the client against an in-process mock of the NoCoDB API
+(httpx.MockTransport), so no requests leave the machine. Like the other
+scripts in this directory, it imports the server module and so needs the
+configuration files to be present.
+
+Usage:
+    python testing/check_client.py
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import time
+
+import httpx
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from nocodb_mcp.server import (
+    CircuitOpenError, MetadataCache, NocoDBClient, PersistentMetadataStore, RecordExportWriter, load_records_file, shape_response
+)
+
+
+class MockNocoDB:
+    """Serves /tables/{id}/records pages from an in-memory list of rows.
+    
+    Writes are accepted without changing the rows, except that a write
+    containing a record whose Title is in `failing_titles` fails with a 500.
+    """
+
+    def __init__(self, rows, max_limit=1000, failing_titles=()):
+        self.rows = rows
+        self.max_limit = max_limit
+        self.failing_titles = set(failing_titles)
+        self.writes = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith('/api/v2/meta/tables/'):
+            return httpx.Response(200, json={'columns': [
+                {'title': 'Id', 'uidt': 'ID', 'pk': True},
+                {'title': 'Title', 'uidt': 'SingleLineText'},
+                {'title': 'N', 'uidt': 'Number'},
+            ]})
+        if request.method != 'GET':
+            body = json.loads(request.content)
+            self.writes.append((request.method, body))
+            if isinstance(body, list) and any(record.get('Title') in self.failing_titles for record in body):
+                return httpx.Response(500, json={'msg': 'write failed'})
+            return httpx.Response(200, json={})
+        params = request.url.params
+        rows = self.rows
+        for field, values in re.findall(r'\((\w+),in,([^)]*)\)', params.get('where', '')):
+            rows = [row for row in rows if str(row.get(field)) in values.split(',')]
+        limit = min(int(params.get('limit', 25)), self.max_limit)
+        offset = int(params.get('offset', 0))
+        page = rows[offset:offset + limit]
+        return httpx.Response(200, json={'list': page, 'pageInfo': {
+            'totalRows': len(rows), 'pageSize': limit, 'isLastPage': offset + limit >= len(rows)
+        }})
+
+
+def make_client(mock: MockNocoDB, **kwargs) -> NocoDBClient:
+    client = NocoDBClient('http://nocodb.local', 'token', 'cf-id', 'cf-secret', **kwargs)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(mock.handler))
+    return client
+
+
+def make_write_counting_client(mock: MockNocoDB, **kwargs) -> tuple:
+    """A client whose writes take a moment, with a dict recording the peak number in flight."""
+    writes = {'active': 0, 'peak': 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == 'GET':
+            return mock.handler(request)
+        writes['active'] += 1
+        writes['peak'] = max(writes['peak'], writes['active'])
+        try:
+            await asyncio.sleep(0.01)
+            return mock.handler(request)
+        finally:
+            writes['active'] -= 1
+
+    client = NocoDBClient('http://nocodb.local', 'token', 'cf-id', 'cf-secret', **kwargs)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, writes
+
+
+def make_scripted_client(responses, **kwargs) -> tuple:
+    """A client answered by `responses` in turn (the last one repeats), with the list of requests seen."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        status, headers = responses[min(len(requests), len(responses)) - 1]
+        return httpx.Response(status, json={'list': []}, headers=headers)
+
+    kwargs.setdefault('retry_backoff', 0.001)
+    client = NocoDBClient('http://nocodb.local', 'token', 'cf-id', 'cf-secret', **kwargs)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, requests
+
+
+async def check_iter_records_capped_pages() -> None:
+    """Pages capped below page_size must not skip or repeat rows."""
+    rows = [{'Id': i} for i in range(1, 1001)]
+    for concurrency in (1, 4):
+        client = make_client(MockNocoDB(rows, max_limit=100))
+        try:
+            ids = [record['Id'] async for record in client.iter_records('T', page_size=250, concurrency=concurrency)]
+        finally:
+            await client.aclose()
+        assert ids == list(range(1, 1001)), f"concurrency={concurrency}: {len(ids)} rows, {len(set(ids))} unique"
+
+
+async def check_persistent_cache_honours_ttls() -> None:
+    """The SQLite store serves cold starts only; expired entries go upstream."""
+    with tempfile.TemporaryDirectory() as directory:
+        store = PersistentMetadataStore(os.path.join(directory, 'meta.sqlite'), 'http://nocodb.local')
+        try:
+            cache = MetadataCache(ttls={'table': 0.05}, store=store)
+            cache.set('/meta/tables/T', 'table', {'id': 'T'})
+            assert cache.get('/meta/tables/T') == {'id': 'T'}
+            time.sleep(0.1)
+            assert cache.get('/meta/tables/T') is None, "expired entry was refilled from the store"
+            restarted = MetadataCache(ttls={'table': 0.05}, store=store)
+            assert restarted.get('/meta/tables/T') == {'id': 'T'}, "cold start did not use the store"
+        finally:
+            store.close()
+
+
+async def check_upsert_failed_rows_use_input_positions() -> None:
+    """failed_rows of an upsert point at positions in the caller's records."""
+    mock = MockNocoDB([{'Id': 1, 'Title': 'a'}, {'Id': 2, 'Title': 'b'}], failing_titles={'c'})
+    client = make_client(mock, retry_attempts=0)
+    try:
+        records = [{'Title': 'a'}, {'Title': 'b'}, {'Title': 'c'}]
+        result = await client.upsert_records('T', records, 'Title')
+    finally:
+        await client.aclose()
+    failed = result['inserted']['failed_rows']
+    assert [(row['index'], row['id']) for row in failed] == [(2, 'c')], failed
+
+
+async def check_upsert_shares_concurrency_limit() -> None:
+    """Inserts and updates of one upsert together stay within `concurrency`."""
+    rows = [{'Id': i, 'Title': f't{i}'} for i in range(1, 41)]
+    records = [{'Title': f't{i}'} for i in range(1, 41)] + [{'Title': f'new{i}'} for i in range(40)]
+    client, writes = make_write_counting_client(MockNocoDB(rows))
+    try:
+        result = await client.upsert_records('T', records, 'Title', chunk_size=10, concurrency=2)
+    finally:
+        await client.aclose()
+    assert (result['matched'], result['inserted']['succeeded_records']) == (40, 40), result
+    assert writes['peak'] <= 2, f"{writes['peak']} writes in flight"
+
+
+async def check_sync_table_csv_nulls_and_empty_input() -> None:
+    """A CSV identical to the table (with empty cells) is a no-op; empty input is refused."""
+    rows = [{'Id': i, 'Title': f't{i}', 'N': i if i % 2 else None} for i in range(1, 6)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'desired.csv')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('Title,N\n' + ''.join(f"{row['Title']},{'' if row['N'] is None else row['N']}\n" for row in rows))
+        records = load_records_file(path)
+    client = make_client(MockNocoDB(rows))
+    try:
+        plan = await client.sync_table('T', records, 'Title', dry_run=True)
+        assert (plan['unchanged'], plan['to_update']) == (5, 0), plan
+        try:
+            await client.sync_table('T', [], 'Title', dry_run=True)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("empty desired set was accepted")
+        plan = await client.sync_table('T', [], 'Title', dry_run=True, allow_empty=True)
+        assert plan['to_delete'] == 5, plan
+    finally:
+        await client.aclose()
+
+
+async def check_sync_table_shares_concurrency_limit() -> None:
+    """Inserts, updates and deletes of one sync together stay within `concurrency`."""
+    rows = [{'Id': i, 'Title': f't{i}', 'N': i} for i in range(1, 61)]
+    records = ([{'Title': f't{i}', 'N': i + 1} for i in range(1, 31)]
+               + [{'Title': f'new{i}', 'N': i} for i in range(30)])
+    client, writes = make_write_counting_client(MockNocoDB(rows))
+    try:
+        result = await client.sync_table('T', records, 'Title', delete_missing=True, chunk_size=10, concurrency=2)
+    finally:
+        await client.aclose()
+    assert (result['to_insert'], result['to_update'], result['to_delete']) == (30, 30, 30), result
+    assert writes['peak'] <= 2, f"{writes['peak']} writes in flight"
+
+
+async def check_cancelled_coalesced_get_is_not_reused() -> None:
+    """A GET cancelled by its only caller must not be joined by the next caller."""
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={'list': [], 'pageInfo': {'isLastPage': True}})
+
+    client = NocoDBClient('http://nocodb.local', 'token', 'cf-id', 'cf-secret')
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(slow))
+    try:
+        first = asyncio.ensure_future(client.get_table_data('T'))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        await asyncio.sleep(0)
+        result = await client.get_table_data('T')
+        assert result['list'] == [], result
+    finally:
+        await client.aclose()
+
+
+async def check_shaped_page_fills_small_budgets() -> None:
+    """A truncated page uses most of a small budget and only notes records that cannot fit."""
+    records = [{'Id': i, 'Title': f'row number {i:04d}'} for i in range(1, 101)]
+    result = {'list': records, 'pageInfo': {'totalRows': len(records)}}
+    row_size = len(json.dumps(records[0], separators=(',', ':')))
+    for budget in (600, 700, 2000):
+        text = shape_response(result, {'table_id': 'T', 'max_bytes': budget}, 'compact')
+        shaped = json.loads(text)
+        assert 'note' not in shaped, (budget, shaped)
+        assert budget - 2 * row_size < len(text.encode()) <= budget, (budget, len(text.encode()))
+        assert shaped['next_offset'] == shaped['returned_rows'], shaped
+    wide = {'list': [{'Id': 1, 'Notes': 'x' * 1000}] + records, 'pageInfo': {}}
+    shaped = json.loads(shape_response(wide, {'table_id': 'T', 'max_bytes': 600}, 'compact'))
+    assert shaped['returned_rows'] == 1 and 'note' in shaped, shaped
+
+
+async def check_retry_classification() -> None:
+    """GETs retry 503s; POSTs retry 429 (never processed) but not 503 (may have been)."""
+    client, requests = make_scripted_client([(503, {}), (503, {}), (200, {})])
+    try:
+        await client.get_table_data('T')
+    finally:
+        await client.aclose()
+    assert len(requests) == 3 and client.retry_stats['retries'] == 2, client.retry_stats
+
+    client, requests = make_scripted_client([(429, {'Retry-After': '0'}), (200, {})])
+    try:
+        await client.create_record('T', {'Title': 'a'})
+    finally:
+        await client.aclose()
+    assert len(requests) == 2, f"POST after 429 sent {len(requests)} times"
+
+    client, requests = make_scripted_client([(503, {}), (200, {})])
+    try:
+        await client.create_record('T', {'Title': 'a'})
+    except Exception:
+        pass
+    else:
+        raise AssertionError("POST answered 503 did not fail")
+    finally:
+        await client.aclose()
+    assert len(requests) == 1, f"POST after 503 sent {len(requests)} times"
+
+
+async def check_retry_after_is_capped() -> None:
+    """Retry-After is honoured in both forms, but never beyond retry_max_backoff."""
+    client = NocoDBClient('http://nocodb.local', 'token', 'cf-id', 'cf-secret', retry_max_backoff=5.0)
+    later = time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime(time.time() + 3600))
+    assert client._retry_delay(0, httpx.Response(429, headers={'Retry-After': '2'})) == 2.0
+    assert client._retry_delay(0, httpx.Response(429, headers={'Retry-After': '120'})) == 5.0
+    assert client._retry_delay(0, httpx.Response(503, headers={'Retry-After': later})) == 5.0
+    assert all(0 <= client._retry_delay(attempt) <= 5.0 for attempt in range(10))
+
+
+async def check_rate_limit_adapts_to_429() -> None:
+    """A 429 halves the request rate once per burst; successes raise it back gradually."""
+    client, requests = make_scripted_client([(429, {'Retry-After': '0'})] * 4 + [(200, {})],
+                                            request_rate_limit=20.0, retry_attempts=0)
+    try:
+        for _ in range(4):
+            try:
+                await client.get_table_data('T')
+            except Exception:
+                pass
+        assert client._request_limiter.rate == 10.0, client._request_limiter.rate
+        assert client.throttle_stats['throttled'] == 4, client.throttle_stats
+        await client.get_table_data('T')
+        assert 10.0 < client._request_limiter.rate < 20.0, client._request_limiter.rate
+    finally:
+        await client.aclose()
+
+
+async def check_max_concurrent_requests() -> None:
+    """No more than max_concurrent_requests requests are in flight across all callers."""
+    state = {'active': 0, 'peak': 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state['active'] += 1
+        state['peak'] = max(state['peak'], state['active'])
+        await asyncio.sleep(0.01)
+        state['active'] -= 1
+        return httpx.Response(200, json={'list': []})
+
+    client = NocoDBClient('http://nocodb.local', 'token', 'cf-id', 'cf-secret', max_concurrent_requests=3)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        await asyncio.gather(*(client.get_table_data('T', offset=offset) for offset in range(12)))
+    finally:
+        await client.aclose()
+    assert state['peak'] == 3, f"{state['peak']} requests in flight"
+
+
+async def check_circuit_breaker_cycle() -> None:
+    """closed -> open -> half-open with a single probe -> closed, and a failed probe re-opens."""
+    upstream = {'status': 502, 'sent': 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        upstream['sent'] += 1
+        await asyncio.sleep(0.02)
+        return httpx.Response(upstream['status'], json={'list': []})
+
+    client = NocoDBClient('http://nocodb.local', 'token', 'cf-id', 'cf-secret', retry_attempts=0,
+                          circuit_failure_threshold=2, circuit_reset_timeout=0.05)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def outcome(offset: int = 0) -> str:
+        try:
+            # Distinct offsets, so concurrent calls are not coalesced into one request
+            await client.get_table_data('T', offset=offset)
+            return 'ok'
+        except CircuitOpenError:
+            return 'rejected'
+        except Exception:
+            return 'failed'
+
+    try:
+        assert [await outcome(), await outcome()] == ['failed', 'failed']
+        assert client.circuit.state == 'open'
+        assert await outcome() == 'rejected' and upstream['sent'] == 2, upstream
+        await asyncio.sleep(0.06)
+        # Half-open: the first caller probes, a concurrent one is rejected; the failed probe re-opens
+        results = await asyncio.gather(outcome(0), outcome(1))
+        assert sorted(results) == ['failed', 'rejected'], results
+        assert upstream['sent'] == 3 and client.circuit.state == 'open', (upstream, client.circuit.stats())
+        await asyncio.sleep(0.06)
+        upstream['status'] = 200
+        results = await asyncio.gather(outcome(0), outcome(1))
+        assert sorted(results) == ['ok', 'rejected'] and upstream['sent'] == 4, (results, upstream)
+        assert client.circuit.state == 'closed' and client.circuit.times_opened == 2, client.circuit.stats()
+        assert await outcome() == 'ok'
+    finally:
+        await client.aclose()
+
+
+async def check_inline_export_returns_non_json_content() -> None:
+    """Inline CSV and Excel exports return their content and are truncated to max_bytes."""
+    csv_body = 'Title,N\n' + ''.join(f't{i},{i}\n' for i in range(1000))
+    xlsx_body = b'PK\x03\x04\x00\xff binary workbook'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith('/export/csv'):
+            return httpx.Response(200, text=csv_body, headers={'Content-Type': 'text/csv'})
+        return httpx.Response(200, content=xlsx_body)
+
+    client = NocoDBClient('http://nocodb.local', 'token', 'cf-id', 'cf-secret')
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        exported = await client.export_table_data('T', 'csv')
+        assert exported['content'] == csv_body, exported
+        shaped = json.loads(shape_response(exported, {'max_bytes': 500}, 'json'))
+        assert shaped['truncated'] and len(shaped['preview'].encode()) <= 500, shaped
+        exported = await client.export_table_data('T', 'excel')
+        assert (exported['encoding'], exported['content']) == ('base64', base64.b64encode(xlsx_body).decode()), exported
+    finally:
+        await client.aclose()
+
+
+async def check_export_records_checksum() -> None:
+    """export_records reports the row count and the SHA-256 of the file it wrote."""
+    rows = [{'Id': i, 'Title': f't{i}', 'N': i} for i in range(1, 251)]
+    client = make_client(MockNocoDB(rows))
+    with tempfile.TemporaryDirectory() as directory:
+        try:
+            result = await client.export_records('T', 'ndjson', os.path.join(directory, 'out.ndjson'), page_size=100)
+        finally:
+            await client.aclose()
+        with open(result['path'], 'rb') as f:
+            content = f.read()
+    assert result['rows'] == 250 and content.count(b'\n') == 250, result
+    assert result['sha256'] == hashlib.sha256(content).hexdigest(), result
+
+
+async def check_parquet_integer_columns() -> None:
+    """ID columns are int64, and non-integral values in int64 columns are rejected."""
+    assert RecordExportWriter.PARQUET_TYPES['ID'] == 'int64'
+    for value, expected in ((7, 7), ('12', 12), (3.0, 3), ('4.0', 4)):
+        assert RecordExportWriter._parquet_value(value, 'int64', 'N') == expected, value
+    for value in (1.5, '1.5', 'abc'):
+        try:
+            RecordExportWriter._parquet_value(value, 'int64', 'N')
+        except ValueError:
+            continue
+        raise AssertionError(f"{value!r} was accepted as int64")
+
+
+CHECKS = [
+    check_iter_records_capped_pages,
+    check_persistent_cache_honours_ttls,
+    check_upsert_failed_rows_use_input_positions,
+    check_upsert_shares_concurrency_limit,
+    check_sync_table_csv_nulls_and_empty_input,
+    check_sync_table_shares_concurrency_limit,
+    check_cancelled_coalesced_get_is_not_reused,
+    check_shaped_page_fills_small_budgets,
+    check_retry_classification,
+    check_retry_after_is_capped,
+    check_rate_limit_adapts_to_429,
+    check_max_concurrent_requests,
+    check_circuit_breaker_cycle,
+    check_inline_export_returns_non_json_content,
+    check_export_records_checksum,
+    check_parquet_integer_columns,
+]
+
+
+async def main() -> int:
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+    logging.getLogger('nocodb-mcp').setLevel(logging.CRITICAL)
+    failures = 0
+    for check in CHECKS:
+        try:
+            await check()
+            print(f"PASS {check.__name__}")
+        except (Exception, asyncio.CancelledError) as e:
+            failures += 1
+            print(f"FAIL {check.__name__}: {e!r}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
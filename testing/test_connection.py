@@ -17,6 +17,7 @@ async def test_connection():
     """Test connection to NoCoDB instance."""
     print("Testing NoCoDB MCP Server connection...")
     
+    client = None
     try:
         # Load configuration
         print("Loading configuration...")
@@ -49,6 +50,9 @@ async def test_connection():
     except Exception as e:
         print(f"❌ Connection failed: {str(e)}")
         return False
+    finally:
+        if client is not None:
+            await client.aclose()
     
     return True
 